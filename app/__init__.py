@@ -35,6 +35,19 @@ Copyright (c) 2025 nanosamfw contributors
 SPDX-License-Identifier: MIT
 """
 
-from app.gui import FirmwareDownloaderApp
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.gui import FirmwareDownloaderApp
 
 __all__ = ["FirmwareDownloaderApp"]
+
+
+def __getattr__(name: str):
+    """Import the GUI lazily so ``import app.config`` does not load Tk (PEP 562)."""
+    if name == "FirmwareDownloaderApp":
+        from app.gui import FirmwareDownloaderApp  # pylint: disable=import-outside-toplevel
+
+        globals()["FirmwareDownloaderApp"] = FirmwareDownloaderApp
+        return FirmwareDownloaderApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 nanosamfw contributors
+
+"""Background task worker for the GUI application.
+
+Startup cleanup, device monitoring and the firmware pipeline share a small set
+of long-lived worker threads fed from one task queue, instead of spawning a
+thread per operation. Unlike ThreadPoolExecutor workers, these threads are
+daemons: a task blocked in a FOTA request or a 30 s download-mode wait does not
+keep the process alive after the window is closed.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+# Queue item telling a worker thread to exit
+_STOP = None
+
+
+class BackgroundWorker:
+    """Runs submitted tasks on daemon worker threads, reporting through futures.
+
+    Worker threads are started on the first submit() and reused for every task
+    until shutdown().
+
+    Attributes:
+        max_workers: Number of worker threads.
+        name: Thread name prefix.
+    """
+
+    def __init__(self, max_workers: int = 1, name: str = "worker"):
+        """Initialize the worker.
+
+        Args:
+            max_workers: Number of worker threads; tasks beyond that wait in the queue.
+            name: Thread name prefix.
+        """
+        self.max_workers = max_workers
+        self.name = name
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._shutdown = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue fn(*args) for a worker thread (any thread).
+
+        Args:
+            fn: Function to run.
+            *args: Positional arguments passed to fn.
+
+        Returns:
+            Future resolved with fn's return value, or with the exception it raised.
+
+        Raises:
+            RuntimeError: If the worker has been shut down.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit tasks after shutdown")
+            if not self._started:
+                self._started = True
+                for i in range(self.max_workers):
+                    threading.Thread(target=self._work, name=f"{self.name}_{i}", daemon=True).start()
+            self._queue.put((future, fn, args))
+        return future
+
+    def shutdown(self, cancel_futures: bool = False) -> None:
+        """Stop the worker threads once they finish their current task (any thread).
+
+        Does not wait: running tasks are left to notice their own stop flags.
+
+        Args:
+            cancel_futures: Cancel tasks that have not started yet.
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    item[0].cancel()
+            for _ in range(self.max_workers):
+                self._queue.put(_STOP)
+
+    def _work(self) -> None:
+        """Worker thread loop: run queued tasks until a stop item is received."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            future, fn, args = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args)
+                except BaseException as ex:  # pylint: disable=broad-exception-caught
+                    future.set_exception(ex)
+                else:
+                    future.set_result(result)
+            # Drop references so a finished task's arguments are not kept alive while idle
+            del item, future, fn, args
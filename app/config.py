@@ -8,21 +8,33 @@ the config.toml file.
 """
 
 import logging
+import mmap
+import os
 import sys
-import tomllib
-from dataclasses import dataclass
+import threading
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 
+# Prefer tomli when installed: its wheels are compiled with mypyc, while the
+# stdlib tomllib is pure Python. Both expose the same load()/loads() API.
+try:
+    import tomli as _toml
+except ImportError:
+    import tomllib as _toml  # type: ignore[no-redef]
 
-@dataclass
-class AppConfig:
-    """Application configuration settings.
+logger = logging.getLogger(__name__)
+
+
+class AppConfig(NamedTuple):
+    """Application configuration settings (immutable).
 
     Attributes:
         btn_dryrun: Show/hide "Dry run" checkbox in GUI.
         btn_autofus: Show/hide "Auto FUS Mode" checkbox in GUI.
         auto_fusmode: Automatically enter device into FUS mode when needed.
         csc_filter: Comma-separated list of CSC codes to filter devices.
+        csc_filter_set: Uppercase CSC codes parsed from csc_filter (empty = accept all).
         ignore_home_csc: Whether to hide HOME_CSC files in the UI (they are always extracted).
     """
 
@@ -31,11 +43,60 @@ class AppConfig:
     auto_fusmode: bool
     csc_filter: str
     ignore_home_csc: bool
+    csc_filter_set: frozenset[str] = frozenset()
+
+
+# Every setting as (config.toml section, AppConfig field, expected type, default)
+_SCHEMA: tuple[tuple[str, str, type, bool | str], ...] = (
+    ("gui", "btn_dryrun", bool, False),
+    ("gui", "btn_autofus", bool, True),
+    ("devices", "auto_fusmode", bool, True),
+    ("devices", "csc_filter", str, ""),
+    ("firmware", "ignore_home_csc", bool, False),
+)
+
+# When frozen (PyInstaller), config.toml lives next to the .exe instead of the package
+_DEFAULT_CONFIG_PATH = (
+    Path(sys.executable).parent
+    if getattr(sys, "frozen", False) and hasattr(sys, "executable")
+    else Path(__file__).parent
+) / "config.toml"
+
+# Shared read-only fallback for sections missing from config.toml
+_EMPTY: MappingProxyType = MappingProxyType({})
+
+# Parsed configs keyed by path, stored with the (mtime_ns, size) they were read at
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], AppConfig]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Files at least this large are mapped into memory instead of read in one call;
+# below it, mmap setup costs more than it saves
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _read_text(path: Path, size: int) -> str:
+    """Read a UTF-8 text file, through mmap when it is large.
+
+    Args:
+        path: File to read.
+        size: File size in bytes, as returned by stat.
+
+    Returns:
+        Decoded file contents.
+    """
+    if size < _MMAP_MIN_SIZE:
+        return path.read_bytes().decode("utf-8")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm[:].decode("utf-8")
 
 
 def load_config(config_path: Path | None = None) -> AppConfig:
     """Load configuration from config.toml file.
 
+    The parsed configuration is cached per path and reused as long as the
+    file's modification time and size are unchanged. Missing sections or keys,
+    and values of the wrong type, fall back to the defaults in ``_SCHEMA``.
+
     Args:
         config_path: Path to config.toml file. If None, uses app/config.toml.
 
@@ -43,58 +104,64 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         AppConfig instance with loaded or default settings.
     """
     if config_path is None:
-        # Resolve config path: when frozen (PyInstaller), load from .exe directory
-        if getattr(sys, "frozen", False) and hasattr(sys, "executable"):
-            base_dir = Path(sys.executable).parent
-        else:
-            base_dir = Path(__file__).parent
-        config_path = base_dir / "config.toml"
+        config_path = _DEFAULT_CONFIG_PATH
 
-    logger = logging.getLogger(__name__)
+    # Bind module globals used in the parse loop to locals (LOAD_FAST in pure-Python builds)
+    make_config = AppConfig
+    empty = _EMPTY
+    warn = logger.warning
 
     try:
-        with open(config_path, "rb") as f:
-            config = tomllib.load(f)
-        logger.info("Loaded config from %s", config_path)
-
-        # GUI settings
-        gui_config = config.get("gui", {})
-        btn_dryrun = gui_config.get("btn_dryrun", False)
-        btn_autofus = gui_config.get("btn_autofus", False)
-
-        # Device settings
-        device_config = config.get("devices", {})
-        auto_fusmode = device_config.get("auto_fusmode", False)
-        csc_filter = device_config.get("csc_filter", "").strip()
-
-        # Firmware settings
-        firmware_config = config.get("firmware", {})
-        ignore_home_csc = firmware_config.get("ignore_home_csc", False)
-
-        logger.info(
-            "Config loaded: dryrun=%s, autofus=%s, auto_fusmode=%s, csc_filter=%s, ignore_home_csc=%s",
-            btn_dryrun,
-            btn_autofus,
-            auto_fusmode,
-            csc_filter,
-            ignore_home_csc,
+        st = os.stat(config_path)
+        key = (st.st_mtime_ns, st.st_size)
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        config = _toml.loads(_read_text(config_path, key[1]))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Loaded config from %s", config_path)
+
+        values: dict[str, bool | str] = {}
+        for section, name, typ, default in _SCHEMA:
+            value = config.get(section, empty).get(name, default)
+            if not isinstance(value, typ):
+                warn("Invalid value for %s.%s: %r. Using default %r.", section, name, value, default)
+                value = default
+            values[name] = value
+        # The filter is usually empty: skip strip/split entirely in that case
+        raw_filter: str = values["csc_filter"]  # type: ignore[assignment]
+        csc_filter = raw_filter.strip() if raw_filter else raw_filter
+        values["csc_filter"] = csc_filter
+
+        cfg = make_config(
+            **values,  # type: ignore[arg-type]
+            csc_filter_set=(
+                frozenset(c.strip().upper() for c in csc_filter.split(",") if c.strip()) if csc_filter else frozenset()
+            ),
         )
 
-        return AppConfig(
-            btn_dryrun=btn_dryrun,
-            btn_autofus=btn_autofus,
-            auto_fusmode=auto_fusmode,
-            csc_filter=csc_filter,
-            ignore_home_csc=ignore_home_csc,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Config loaded: dryrun=%s, autofus=%s, auto_fusmode=%s, csc_filter=%s, ignore_home_csc=%s",
+                values["btn_dryrun"],
+                values["btn_autofus"],
+                values["auto_fusmode"],
+                values["csc_filter"],
+                values["ignore_home_csc"],
+            )
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[config_path] = (key, cfg)
+        return cfg
 
     except (FileNotFoundError, OSError) as ex:
         # Use defaults if config file not found
-        logger.warning("Config file not found or error reading: %s. Using defaults.", ex)
-        return AppConfig(
-            btn_dryrun=False,
-            btn_autofus=True,
-            auto_fusmode=True,
-            csc_filter="",
-            ignore_home_csc=True,
-        )
+        warn("Config file not found or error reading: %s. Using defaults.", ex)
+        return make_config(**{name: default for _, name, _, default in _SCHEMA})  # type: ignore[arg-type]
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configurations so the next load_config() re-reads the file."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
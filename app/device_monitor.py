@@ -7,22 +7,83 @@ This module handles device detection, firmware checking, downloading,
 decrypting, and extracting in a background thread.
 """
 
+import functools
 import logging
+import sys
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Callable
 
-from device import DeviceNotFoundError, enter_odin_mode, read_device_info_at
+from app.background import BackgroundWorker
+from app.ui_updater import COLOR_ERROR, COLOR_SUCCESS, COLOR_WARNING
+from device import ATSession, DeviceNotFoundError, HotplugWatcher, enter_odin_mode
+from device.at_client import ATDeviceInfo
 from device.errors import DeviceATError, DeviceError
-from download import check_and_prepare_firmware, download_and_decrypt, extract_firmware
+from device.hotplug import ACTION_REMOVE
+from download import TaskStoppedError, check_and_prepare_firmware, download_and_decrypt, extract_firmware
 from fus.errors import FOTAModelOrRegionNotFound, FOTANoFirmware, InformError
 
+# Probe interval for a connected device without hotplug notifications (seconds)
+_POLL_INTERVAL = 1.0
+# Probe interval right after a disconnect or hotplug event while no device is present (seconds)
+_NO_DEVICE_POLL_INTERVAL = 0.1
+# The no-device interval doubles after each empty probe up to this cap (seconds)
+_NO_DEVICE_MAX_POLL_INTERVAL = 2.0
+# Fallback probe interval while hotplug notifications are active (seconds)
+_HOTPLUG_POLL_INTERVAL = 5.0
+# Keep fast probing this long after a hotplug event while the modem enumerates (seconds)
+_HOTPLUG_SETTLE_TIME = 5.0
+# Safety re-probe interval for a connected device while hotplug notifications are active (seconds)
+_CONNECTED_PROBE_INTERVAL = 30.0
+# How long a FOTA result is reused when the same device reconnects (seconds)
+_FOTA_CACHE_TTL = 60.0
+# Back-off after device or unexpected errors (seconds)
+_ERROR_RETRY_INTERVAL = 2.0
+
+# Known DownloadBinaryInform status codes: (message, progress color, log level)
+_FUS_STATUS_TABLE: dict[int, tuple[str, tuple[str, str], int]] = {
+    400: ("Please update via OTA (Over-The-Air)", COLOR_WARNING, logging.WARNING),
+    408: ("Invalid model, CSC, or IMEI. Please check device information", COLOR_ERROR, logging.ERROR),
+}
+
+
+class _Coalescer:
+    """Rate-limits progress callbacks coming from download/decrypt/extract loops.
+
+    Forwards an update at most once per min_interval seconds per stage; stage
+    changes and stage completion (done >= total) are always forwarded.
+    """
+
+    def __init__(self, callback: Callable[[str, int, int], None], min_interval: float = 0.05):
+        """Initialize coalescer.
+
+        Args:
+            callback: Function(stage, done, total) receiving forwarded updates.
+            min_interval: Minimum time between forwarded updates (seconds).
+        """
+        self.callback = callback
+        self.min_interval = min_interval
+        self._last_time = 0.0
+        self._last_stage: str | None = None
+
+    def __call__(self, stage: str, done: int, total: int) -> None:
+        now = time.monotonic()
+        if stage == self._last_stage and done < total and now - self._last_time < self.min_interval:
+            return
+        self._last_stage = stage
+        self._last_time = now
+        self.callback(stage, done, total)
+
 
 class DeviceMonitor:
     """Monitors for Samsung device connections and orchestrates firmware operations.
 
-    Runs in a background thread, detecting devices via AT commands, checking
-    for firmware updates, and coordinating download/decrypt/extract operations.
+    Runs in a background thread, detecting devices via AT commands and checking
+    for firmware updates. Download/decrypt/extract operations are submitted to a
+    BackgroundWorker, one pipeline at a time, so the monitor loop stays responsive.
 
     CSC Filter Logic:
     - Empty filter (default) = accept all devices
@@ -31,9 +92,9 @@ class DeviceMonitor:
     Attributes:
         ui_updater: UIUpdater instance for thread-safe UI updates.
         progress_callback: Callback for progress updates.
-        stop_check: Function that returns True if task should stop.
+        stop_check: Function that returns True if task should stop (e.g. threading.Event.is_set).
         disconnect_callback: Optional callback invoked when device disconnects.
-        csc_filter: Set of allowed CSC codes (empty = accept all).
+        csc_filter: Frozenset of allowed CSC codes (empty = accept all).
         ignore_home_csc: Whether to hide HOME_CSC files from the UI display.
         logger: Logger instance.
     """
@@ -44,9 +105,10 @@ class DeviceMonitor:
         progress_callback: Callable[[str, int, int], None],
         stop_check: Callable[[], bool],
         disconnect_callback: Callable[[], None] | None = None,
-        csc_filter: list[str] | None = None,
+        csc_filter: Iterable[str] | None = None,
         ignore_home_csc: bool = False,
         autofus_checkbox=None,
+        worker: BackgroundWorker | None = None,
     ):
         """Initialize device monitor.
 
@@ -55,133 +117,316 @@ class DeviceMonitor:
             progress_callback: Function(stage, done, total) for progress updates.
             stop_check: Function returning True if task should be stopped.
             disconnect_callback: Optional callback invoked when device disconnects.
-            csc_filter: Optional list of allowed CSC codes (case-insensitive).
-                Empty list = accept all devices. Non-empty = only accept listed CSCs.
+            csc_filter: Optional collection of allowed CSC codes (case-insensitive),
+                e.g. AppConfig.csc_filter_set. Empty = accept all devices.
+                Non-empty = only accept listed CSCs.
             ignore_home_csc: Whether to hide HOME_CSC files from UI display.
             autofus_checkbox: Optional reference to the Auto FUS Mode checkbox widget.
-                If provided, its current state is checked at runtime for entering download mode.
+                If provided, its state is mirrored into a threading.Event (via the widget's
+                command callback) and checked at runtime for entering download mode.
+                Must be passed from the main thread.
+            worker: BackgroundWorker running the firmware pipeline (needs a free thread
+                besides the one running start()). Defaults to a private single-thread worker.
         """
         self.ui_updater = ui_updater
         self.progress_callback = progress_callback
+        self._progress = _Coalescer(progress_callback)
         self.stop_check = stop_check
         self.disconnect_callback = disconnect_callback
-        self.csc_filter: set[str] = {c.strip().upper() for c in csc_filter} if csc_filter else set()
+        self.csc_filter: frozenset[str] = (
+            frozenset(sys.intern(c.strip().upper()) for c in csc_filter) if csc_filter else frozenset()
+        )
         self.ignore_home_csc = ignore_home_csc
         self.autofus_checkbox = autofus_checkbox
+        self._autofus_enabled = threading.Event()
+        if autofus_checkbox is not None:
+            self._sync_autofus()
+            autofus_checkbox.configure(command=self._sync_autofus)
         self.logger = logging.getLogger(__name__)
         self.monitoring = False
         self.download_in_progress = False
+        self._wake = threading.Event()
+        self._removed = threading.Event()
+        self._hotplug = HotplugWatcher(self._on_hotplug)
+        self._last_hotplug = 0.0
+        self._idle_interval = _NO_DEVICE_POLL_INTERVAL
+        self._device_connected = False
+        self._last_device_model: str | None = None
+        # IMEI of the device currently connected, read by the pipeline worker to tell whether
+        # the device it started for is still there
+        self._connected_imei: str | None = None
+        self._worker = worker if worker is not None else BackgroundWorker(name="fw-io")
+        self._pipeline: Future | None = None
+        self._at_lock = threading.Lock()
+        # Serial port kept open across probes while the device stays connected (guarded by _at_lock)
+        self._at_session: ATSession | None = None
+        # (model, sales_code, imei) -> (latest FOTA version, monotonic timestamp)
+        self._fota_cache: dict[tuple[str, str, str], tuple[str, float]] = {}
 
     def start(self) -> None:
         """Start device monitoring loop (call from background thread)."""
         self.monitoring = True
-        self._monitor_loop()
+        self._wake.clear()
+        self._removed.clear()
+        if self._hotplug.start():
+            self.logger.info("USB hotplug notifications enabled")
+        try:
+            self._monitor_loop()
+        finally:
+            self._hotplug.stop()
+            with self._at_lock:
+                self._close_at_session()
 
     def stop(self) -> None:
         """Stop device monitoring."""
         self.monitoring = False
+        self._wake.set()
 
-    def _monitor_loop(self) -> None:
-        """Main device monitoring loop."""
-        device_connected = False
-        last_device_model = None
+    def _sync_autofus(self) -> None:
+        """Mirror the Auto FUS Mode checkbox state for worker threads (main thread only)."""
+        if self.autofus_checkbox.get():
+            self._autofus_enabled.set()
+        else:
+            self._autofus_enabled.clear()
+
+    def _on_hotplug(self, action: str) -> None:
+        """Wake the monitor loop on USB attach/remove (called from watcher thread).
+
+        Args:
+            action: Hotplug action ("add" or "remove").
+        """
+        self.logger.debug("USB hotplug event: %s", action)
+        self._last_hotplug = time.monotonic()
+        self._idle_interval = _NO_DEVICE_POLL_INTERVAL
+        if action == ACTION_REMOVE:
+            self._removed.set()
+        self._wake.set()
 
+    def _wait(self, timeout: float) -> None:
+        """Sleep until timeout, a hotplug event or stop(), whichever comes first.
+
+        Args:
+            timeout: Maximum wait time in seconds.
+        """
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+    def _poll_interval(self) -> float:
+        """Return the probe interval for the current hotplug state.
+
+        Without a device, probing only enumerates serial ports: it starts at 100 ms
+        after a disconnect or hotplug event for fast reconnect detection and backs
+        off exponentially to 2 s while nothing shows up. A connected device is probed
+        every second to avoid hammering it with AT commands. Hotplug events only say
+        that something changed on the bus; the serial modem may answer AT commands a
+        few seconds later, so fast probing is kept for a short settle period after each event.
+        """
+        if self._device_connected:
+            fast_interval = _POLL_INTERVAL
+        else:
+            fast_interval = self._idle_interval
+            self._idle_interval = min(fast_interval * 2, _NO_DEVICE_MAX_POLL_INTERVAL)
+        if not self._hotplug.active:
+            return fast_interval
+        if time.monotonic() - self._last_hotplug < _HOTPLUG_SETTLE_TIME:
+            return fast_interval
+        return _HOTPLUG_POLL_INTERVAL
+
+    def _wait_while_connected(self) -> None:
+        """Wait until the connected device should be probed again.
+
+        Without hotplug notifications this is a regular poll. With them, AT probes
+        are skipped until a USB removal is reported (or the safety interval elapses),
+        so a connected device is not hit with a serial round-trip every second.
+        """
+        if not self._hotplug.active:
+            self._wait(self._poll_interval())
+            return
+
+        deadline = time.monotonic() + _CONNECTED_PROBE_INTERVAL
         while self.monitoring:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._wait(remaining)
+            if self._removed.is_set():
+                self._removed.clear()
+                return
+
+    def _probe_device(self) -> ATDeviceInfo:
+        """Read device info over the persistent AT session, opening it when needed.
+
+        A failing existing session is dropped and the probe retried once on a fresh
+        port, so an unplug surfaces as DeviceNotFoundError rather than a serial error.
+
+        Returns:
+            Device information from AT+DEVCONINFO.
+
+        Raises:
+            DeviceNotFoundError: If no Samsung device is connected.
+            DeviceError: If AT communication fails on a freshly opened port.
+        """
+        with self._at_lock:
+            return self._probe_device_locked()
+
+    def _probe_device_locked(self) -> ATDeviceInfo:
+        """Body of _probe_device() for callers that already hold _at_lock."""
+        if self._at_session is not None:
             try:
-                # Try to detect device via AT commands
-                device = read_device_info_at()
+                return self._at_session.read_device_info()
+            except DeviceATError as ex:
+                self.logger.debug("AT session on %s failed, reopening: %s", self._at_session.port_name, ex)
+                self._close_at_session()
 
-                # Device found
-                if not device_connected:
-                    # New device connection
-                    device_connected = True
-                    last_device_model = device.model
-                    self.logger.info("Device connected: %s", device.model)
-                    self.logger.info("CSC: %s, AID: %s, CC: %s", device.sales_code, device.aid, device.cc)
-                    self.logger.info(
-                        "IMEI: %s, SN: %s, LOCK: %s",
-                        device.imei,
-                        device.serial_number,
-                        device.lock_status,
-                    )
-                    self.logger.info("Firmware: %s", device.firmware_version)
-
-                    # Clear old component paths from previous device
-                    self.ui_updater.clear_component_entries()
-
-                    # Update device fields first (before any filtering check)
-                    self.ui_updater.update_device_fields(
-                        device.model,
-                        device.firmware_version,
-                        device.sales_code,
-                        device.imei,
-                        aid=device.aid or "-",
-                        cc=device.cc or "-",
-                    )
+        session = ATSession()
+        try:
+            device = session.read_device_info()
+        except DeviceError:
+            session.close()
+            raise
+        self._at_session = session
+        return device
+
+    def _close_at_session(self) -> None:
+        """Close the persistent AT session, if any (caller holds _at_lock)."""
+        if self._at_session is not None:
+            self._at_session.close()
+            self._at_session = None
 
-                    # Check CSC filter (empty = allow all, non-empty = only allow listed CSCs)
-                    device_csc = (device.sales_code or "").strip().upper()
-                    if self.csc_filter and device_csc and device_csc not in self.csc_filter:
-                        self.logger.info("Device rejected by CSC filter: %s (%s)", device.model, device_csc)
-                        self.ui_updater.update_status("Device filtered by CSC")
-                        self.ui_updater.update_progress_message("CSC Filtered", "warning")
-                        # Skip processing for this device, wait for disconnect
-                        time.sleep(1)
-                        continue
+    def _monitor_loop(self) -> None:
+        """Main device monitoring loop."""
+        # Bind hot attributes to locals once for the lifetime of the loop
+        logger = self.logger
+        probe_device = self._probe_device
+        wait = self._wait
+        wait_while_connected = self._wait_while_connected
 
-                    self.ui_updater.update_status("Device detected! Checking firmware...")
+        self._device_connected = False
+        self._last_device_model = None
+        self._connected_imei = None
+        self._idle_interval = _NO_DEVICE_POLL_INTERVAL
 
-                    # Check for firmware and handle download/decrypt/extract
-                    self._handle_firmware_check(device)
+        while self.monitoring:
+            try:
+                # Try to detect device via AT commands
+                device = probe_device()
 
-                    # Wait for device disconnect after processing
-                    self.ui_updater.update_status("Waiting for device disconnect...")
+                # Device found
+                if not self._device_connected:
+                    self._handle_device_connected(device)
 
                 # Device still connected, wait for disconnect
-                time.sleep(1)
+                wait_while_connected()
 
             except DeviceNotFoundError:
                 # Device disconnected or not present
-                if device_connected:
-                    # Device was connected, now disconnected
-                    self.logger.info("Device disconnected: %s", last_device_model)
-                    device_connected = False
-                    last_device_model = None
-                    self.ui_updater.update_status("Device disconnected. Waiting for new device...")
-                    self.ui_updater.set_device_placeholders()
-                    # Keep component paths visible until new device connects
-                    self.ui_updater.update_progress_message("Waiting for device", "info")
-
-                    # Reset stop flag for next device
-                    if self.disconnect_callback:
-                        self.disconnect_callback()
+                self._handle_device_absent()
 
                 # Wait before checking again
-                time.sleep(1)
+                wait(self._poll_interval())
 
             except DeviceError as ex:
-                msg = f"Device error: {ex}"
-                self.logger.error(msg)
-                # Reset connection state to allow fresh detection attempts
-                device_connected = False
-                last_device_model = None
-                self.ui_updater.update_status("Device error detected - Retrying detection")
-                self.ui_updater.set_device_placeholders()
-                # Keep component paths visible until new device connects
-                # Keep progress zone clean of communication errors
-                self.ui_updater.update_progress_message("Waiting for device", "info")
-                time.sleep(2)
-
-            except (OSError, IOError, ValueError, RuntimeError) as ex:
-                msg = f"Unexpected error: {ex}"
-                self.logger.error(msg)
-                device_connected = False
-                last_device_model = None
-                self.ui_updater.update_status("Error occurred - Retrying detection")
-                self.ui_updater.set_device_placeholders()
-                # Keep component paths visible until new device connects
-                self.ui_updater.update_progress_message("Waiting for device", "info")
-                time.sleep(2)
+                logger.error("Device error: %s", ex)
+                self._reset_after_error("Device error detected - Retrying detection", _ERROR_RETRY_INTERVAL)
+
+            except (OSError, ValueError, RuntimeError) as ex:
+                logger.error("Unexpected error: %s", ex)
+                self._reset_after_error("Error occurred - Retrying detection", _ERROR_RETRY_INTERVAL)
+
+    def _handle_device_connected(self, device: ATDeviceInfo) -> None:
+        """Handle a newly connected device: log it, apply the CSC filter, check firmware.
+
+        Args:
+            device: Device information read over AT commands.
+        """
+        logger = self.logger
+        ui = self.ui_updater
+
+        self._device_connected = True
+        self._last_device_model = device.model
+        self._connected_imei = device.imei
+        logger.info("Device connected: %s", device.model)
+        logger.info("CSC: %s, AID: %s, CC: %s", device.sales_code, device.aid, device.cc)
+        logger.info(
+            "IMEI: %s, SN: %s, LOCK: %s",
+            device.imei,
+            device.serial_number,
+            device.lock_status,
+        )
+        logger.info("Firmware: %s", device.firmware_version)
+
+        # Check CSC filter (empty = allow all, non-empty = only allow listed CSCs).
+        # The CSC cannot change without a reconnect, so this only runs on connect,
+        # and before any UI update so a rejected device costs a single status post.
+        if self.csc_filter:
+            device_csc = sys.intern((device.sales_code or "").strip().upper())
+            if device_csc and device_csc not in self.csc_filter:
+                logger.info("Device rejected by CSC filter: %s (%s)", device.model, device_csc)
+                ui.apply(status="Device filtered by CSC", progress="CSC Filtered", progress_color=COLOR_WARNING)
+                # Skip processing for this device, the loop waits for disconnect
+                return
+
+        # Clear old component paths from previous device
+        ui.clear_component_entries()
+
+        ui.update_device_fields(
+            device.model,
+            device.firmware_version,
+            device.sales_code,
+            device.imei,
+            aid=device.aid or "-",
+            cc=device.cc or "-",
+        )
+
+        ui.update_status("Device detected! Checking firmware...")
+
+        # Check for firmware; download/decrypt/extract runs on the background worker
+        self._handle_firmware_check(device)
+
+        # Wait for device disconnect after processing (the pipeline reports its own status)
+        if not self._pipeline_running():
+            ui.update_status("Waiting for device disconnect...")
+
+    def _handle_device_absent(self) -> None:
+        """Handle a probe that found no device; reports a disconnect if one was connected."""
+        with self._at_lock:
+            self._close_at_session()
+        if not self._device_connected:
+            return
+
+        # Device was connected, now disconnected
+        self.logger.info("Device disconnected: %s", self._last_device_model)
+        self._device_connected = False
+        self._idle_interval = _NO_DEVICE_POLL_INTERVAL
+        self._last_device_model = None
+        self._connected_imei = None
+        # Keep component paths visible until new device connects
+        self.ui_updater.apply(status="Device disconnected. Waiting for new device...", progress="Waiting for device")
+        self.ui_updater.set_device_placeholders()
+
+        # Reset stop flag for next device; a running pipeline outlives the disconnect and
+        # must still see a pending stop, so _on_pipeline_done() resets it in that case
+        if self.disconnect_callback and not self._pipeline_running():
+            self.disconnect_callback()
+
+    def _reset_after_error(self, status: str, retry_delay: float) -> None:
+        """Reset connection state and UI after a detection error, then back off.
+
+        Component paths stay visible until a new device connects, and the progress
+        zone is kept clean of communication errors.
+
+        Args:
+            status: Status message to display.
+            retry_delay: Time to wait before the next detection attempt (seconds).
+        """
+        self._device_connected = False
+        self._last_device_model = None
+        self._connected_imei = None
+        with self._at_lock:
+            self._close_at_session()
+        self.ui_updater.apply(status=status, progress="Waiting for device")
+        self.ui_updater.set_device_placeholders()
+        self._wait(retry_delay)
 
     def _handle_firmware_check(self, device) -> None:
         """Check for firmware updates and handle download/decrypt/extract.
@@ -189,8 +434,17 @@ class DeviceMonitor:
         Args:
             device: ATDeviceInfo instance with device information.
         """
+        cache_key = (device.model, device.sales_code, device.imei)
         try:
-            self.logger.info("Checking FOTA for %s/%s", device.model, device.sales_code)
+            # Reuse a recent FOTA answer on quick reconnects; the repository check still runs
+            fota_version = None
+            cached_fota = self._fota_cache.get(cache_key)
+            if cached_fota and time.monotonic() - cached_fota[1] < _FOTA_CACHE_TTL:
+                fota_version = cached_fota[0]
+                self.logger.info("Using cached FOTA version for %s/%s", device.model, device.sales_code)
+            else:
+                self.logger.info("Checking FOTA for %s/%s", device.model, device.sales_code)
+
             latest, is_cached = check_and_prepare_firmware(
                 device.model,
                 device.sales_code,
@@ -200,104 +454,151 @@ class DeviceMonitor:
                 lock_status=device.lock_status,
                 aid=device.aid,
                 cc=device.cc,
+                fota_version=fota_version,
             )
+            if fota_version is None:
+                now = time.monotonic()
+                # Drop expired entries so devices seen once do not accumulate
+                for key in [k for k, (_, ts) in self._fota_cache.items() if now - ts >= _FOTA_CACHE_TTL]:
+                    del self._fota_cache[key]
+                self._fota_cache[cache_key] = (latest, now)
             self.logger.info("FOTA returned version: %s (cached: %s)", latest, is_cached)
 
             if latest == device.firmware_version:
                 msg = f"Firmware already latest version: {latest}"
                 self.logger.info(msg)
-                self.ui_updater.update_status("Device connected")
-                self.ui_updater.update_progress_message(msg, "success")
-
-            elif is_cached:
-                # Firmware already downloaded, just decrypt and extract
-                self._handle_cached_firmware(device, latest)
+                self.ui_updater.apply(status="Device connected", progress=msg, progress_color=COLOR_SUCCESS)
 
             else:
-                # Download firmware via FUS
-                self._handle_firmware_download(device, latest)
+                # Download firmware via FUS unless already cached, then decrypt and extract
+                self._submit_pipeline(device, latest, is_cached)
 
         except FOTAModelOrRegionNotFound:
+            self._fota_cache.pop(cache_key, None)
             msg = "Model or CSC not recognized by FOTA"
             self.logger.warning("%s: %s/%s", msg, device.model, device.sales_code)
-            self.ui_updater.update_status("Device connected")
-            self.ui_updater.update_progress_message(msg, "warning")
+            self.ui_updater.apply(status="Device connected", progress=msg, progress_color=COLOR_WARNING)
 
         except FOTANoFirmware:
+            self._fota_cache.pop(cache_key, None)
             msg = "No firmware available from FOTA"
             self.logger.warning("%s for %s/%s", msg, device.model, device.sales_code)
-            self.ui_updater.update_status("Device connected")
-            self.ui_updater.update_progress_message(msg, "warning")
+            self.ui_updater.apply(status="Device connected", progress=msg, progress_color=COLOR_WARNING)
 
-        except (OSError, IOError, ValueError, RuntimeError) as ex:
-            # Generic non-firmware error during check/download
-            msg = f"Error: {ex}"
-            self.logger.error(msg)
-            self.ui_updater.update_status("Device connected - Firmware operation error")
-            self.ui_updater.update_progress_message("Waiting for device", "info")
-            self.download_in_progress = False
-            self.ui_updater.update_stop_button_state(self.download_in_progress, self.stop_check())
+        except (OSError, ValueError, RuntimeError) as ex:
+            self._handle_firmware_error(ex, device)
+
+    def _submit_pipeline(self, device, latest: str, cached: bool) -> None:
+        """Run the download/decrypt/extract pipeline on the background worker.
 
-    def _handle_cached_firmware(self, device, latest: str) -> None:
-        """Handle cached firmware preparation (decrypt and extract).
+        Keeps the monitor loop free to notice disconnects and stop() while
+        multi-gigabyte firmware is being processed. A disconnect does not stop a
+        running pipeline, so while one is queued or running (e.g. the device was
+        replugged mid-download) no second pipeline is started.
 
         Args:
             device: ATDeviceInfo instance.
             latest: Latest firmware version string.
+            cached: Whether the firmware is already in the repository.
         """
-        msg = f"Firmware {latest} found in repository. Preparing..."
-        self.logger.info(msg)
-        self.ui_updater.update_status("Device connected - Preparing cached firmware")
-        self.ui_updater.update_progress_message(msg, "info")
+        if not self.monitoring:
+            return
+        if self._pipeline_running():
+            self.logger.info("Firmware task still running, not starting another for %s", latest)
+            return
+        self._pipeline = self._worker.submit(self._run_pipeline, device, latest, cached)
+        self._pipeline.add_done_callback(functools.partial(self._on_pipeline_done, device))
+
+    def _run_pipeline(self, device, latest: str, cached: bool) -> None:
+        """Worker entry point: run the pipeline and report errors it does not handle itself."""
+        try:
+            self._run_download_pipeline(device, latest, cached)
+        except (OSError, ValueError, RuntimeError) as ex:
+            self._handle_firmware_error(ex, device)
 
-        self.download_in_progress = True
-        self.ui_updater.update_stop_button_state(self.download_in_progress, False)
+    def _on_pipeline_done(self, device, future: Future) -> None:
+        """Finish a pipeline run (runs on the worker thread).
 
-        try:
-            # Use cached firmware - will skip download
-            firmware, decrypted = download_and_decrypt(
-                device.model,
-                device.sales_code,
-                device.imei,
-                device.firmware_version,
-                version=latest,  # Pass version to avoid duplicate FOTA query
-                resume=True,
-                progress_cb=self.progress_callback,
-                stop_check=self.stop_check,
-                serial_number=device.serial_number,
-                lock_status=device.lock_status,
-                aid=device.aid,
-                cc=device.cc,
-            )
+        Resets the stop flag if the device disconnected while the pipeline ran. An
+        exception _run_pipeline() did not handle (e.g. a FUSError subclass) is logged
+        and reported like the in-pipeline error paths: status, progress message and
+        stop button are reset.
 
-            msg = f"Cached firmware ready! Version: {firmware.version_code}"
-            self.logger.info("%s decrypted to %s", msg, decrypted)
+        Args:
+            device: ATDeviceInfo the pipeline ran for.
+            future: Future of the _run_pipeline() call.
+        """
+        if self.disconnect_callback and self._connected_imei != device.imei:
+            self.disconnect_callback()
+        # Cancelled when the worker shuts down before the pipeline started
+        ex = None if future.cancelled() else future.exception()
+        if ex is None:
+            return
+        self.logger.error("Firmware task failed: %s", ex, exc_info=ex)
+        self.download_in_progress = False
+        self.ui_updater.apply(
+            status=self._device_status(device, "Device connected - Firmware operation error"),
+            progress=f"Firmware task failed: {ex}",
+            progress_color=COLOR_ERROR,
+            stop_button=(self.download_in_progress, False),
+        )
 
-            # Extract firmware
-            self._extract_firmware(Path(decrypted), firmware.version_code)
+    def _pipeline_running(self) -> bool:
+        """Return True while a firmware pipeline is queued or running."""
+        return self._pipeline is not None and not self._pipeline.done()
 
-            self.ui_updater.update_status("Device connected")
-            self.ui_updater.update_progress_message(msg, "success")
-            self.download_in_progress = False
-            self.ui_updater.update_stop_button_state(self.download_in_progress, False)
+    def _device_status(self, device, status: str) -> str | None:
+        """Return a "Device connected ..." status, or None once that device has gone.
 
-        except RuntimeError as ex:
-            self._handle_runtime_error(ex)
+        The pipeline outlives disconnects; its statuses must not claim the device is
+        still connected (None leaves the status bar to the monitor loop).
 
-        except InformError.BadStatus as ex:
-            self._handle_fus_error(ex)
+        Args:
+            device: ATDeviceInfo the status is about.
+            status: Status message to display while the device is connected.
+        """
+        return status if self._connected_imei == device.imei else None
+
+    def _handle_firmware_error(self, ex: Exception, device) -> None:
+        """Handle generic non-firmware errors during check/download.
+
+        Args:
+            ex: The raised exception.
+            device: ATDeviceInfo the operation was for.
+        """
+        self.logger.error("Error: %s", ex)
+        self.download_in_progress = False
+        self.ui_updater.apply(
+            status=self._device_status(device, "Device connected - Firmware operation error"),
+            progress="Waiting for device",
+            stop_button=(self.download_in_progress, self.stop_check()),
+        )
 
-    def _handle_firmware_download(self, device, latest: str) -> None:
-        """Handle firmware download, decrypt, and extract.
+    def _run_download_pipeline(self, device, latest: str, cached: bool) -> None:
+        """Download (unless cached), decrypt and extract firmware.
 
         Args:
             device: ATDeviceInfo instance.
             latest: Latest firmware version string.
+            cached: Whether the firmware is already in the repository (skips download).
         """
+        # Snapshot Auto FUS Mode once per firmware cycle
+        autofus_enabled = self._autofus_enabled.is_set()
         self.download_in_progress = True
-        self.ui_updater.update_stop_button_state(self.download_in_progress, False)
-        self.logger.info("Downloading %s (current: %s)", latest, device.firmware_version)
-        self.ui_updater.update_status("Device connected - Downloading firmware")
+        if cached:
+            msg = f"Firmware {latest} found in repository. Preparing..."
+            self.logger.info(msg)
+            self.ui_updater.apply(
+                status=self._device_status(device, "Device connected - Preparing cached firmware"),
+                progress=msg,
+                stop_button=(self.download_in_progress, False),
+            )
+        else:
+            self.logger.info("Downloading %s (current: %s)", latest, device.firmware_version)
+            self.ui_updater.apply(
+                status=self._device_status(device, "Device connected - Downloading firmware"),
+                stop_button=(self.download_in_progress, False),
+            )
 
         try:
             firmware, decrypted = download_and_decrypt(
@@ -307,7 +608,7 @@ class DeviceMonitor:
                 device.firmware_version,
                 version=latest,  # Pass version to avoid duplicate FOTA query
                 resume=True,
-                progress_cb=self.progress_callback,
+                progress_cb=self._progress,
                 stop_check=self.stop_check,
                 serial_number=device.serial_number,
                 lock_status=device.lock_status,
@@ -315,141 +616,180 @@ class DeviceMonitor:
                 cc=device.cc,
             )
 
-            msg = f"Download complete! Version: {firmware.version_code}"
-            self.logger.info("%s saved to %s", msg, decrypted)
+            if cached:
+                msg = f"Cached firmware ready! Version: {firmware.version_code}"
+                self.logger.info("%s decrypted to %s", msg, decrypted)
+            else:
+                msg = f"Download complete! Version: {firmware.version_code}"
+                self.logger.info("%s saved to %s", msg, decrypted)
 
             # Extract firmware
-            self._extract_firmware(Path(decrypted), firmware.version_code)
+            self._extract_firmware(device, decrypted, firmware.version_code, autofus_enabled)
 
-            self.ui_updater.update_status("Device connected")
-            self.ui_updater.update_progress_message(msg, "success")
             self.download_in_progress = False
-            self.ui_updater.update_stop_button_state(self.download_in_progress, False)
+            self.ui_updater.apply(
+                status=self._device_status(device, "Device connected"),
+                progress=msg,
+                progress_color=COLOR_SUCCESS,
+                stop_button=(self.download_in_progress, False),
+            )
+
+        except TaskStoppedError as ex:
+            self._handle_task_stopped(ex, device)
 
         except RuntimeError as ex:
-            self._handle_runtime_error(ex)
+            self._handle_runtime_error(ex, device)
 
         except InformError.BadStatus as ex:
-            self._handle_fus_error(ex)
+            self._handle_fus_error(ex, device)
 
-    def _extract_firmware(self, decrypted_path: Path, version: str) -> None:
+    def _extract_firmware(self, device, decrypted_path: Path, version: str, autofus_enabled: bool) -> None:
         """Extract firmware ZIP file, compute checksums, and clean up files.
 
         Uses the download service to extract the firmware file, compute MD5
         checksums for components, and automatically clean up encrypted and
         decrypted files after successful extraction.
-        If Auto FUS Mode checkbox is checked, enters download mode after extraction.
+        If Auto FUS Mode is enabled, enters download mode after extraction.
 
         Args:
+            device: ATDeviceInfo the firmware was downloaded for.
             decrypted_path: Path to decrypted firmware file.
             version: Firmware version string (version_code).
+            autofus_enabled: Auto FUS Mode state snapshotted when the firmware cycle started.
         """
         try:
-            if decrypted_path.exists() and decrypted_path.suffix.lower() in [".zip"]:
-                self.ui_updater.update_status("Device connected - Extracting firmware")
+            if decrypted_path.suffix.lower() == ".zip":
+                self.ui_updater.apply(status=self._device_status(device, "Device connected - Extracting firmware"))
 
                 unzip_dir = extract_firmware(
                     decrypted_path,
                     version_code=version,
                     cleanup_after=True,  # Clean up encrypted and decrypted files
-                    progress_cb=self.progress_callback,
+                    progress_cb=self._progress,
                     stop_check=self.stop_check,
                 )
 
                 self.logger.info("Extracted firmware to %s", unzip_dir)
                 self.ui_updater.populate_component_entries(unzip_dir, ignore_home_csc=self.ignore_home_csc)
 
-                # Check if Auto FUS Mode checkbox is currently checked
-                if self.autofus_checkbox and self.autofus_checkbox.get():
-                    self._enter_download_mode_auto()
+                if autofus_enabled:
+                    self._enter_download_mode_auto(device)
 
         except ValueError as ex:
             self.logger.error("Extraction error: %s", ex)
-        except (OSError, IOError, RuntimeError) as ex:
-            if "stopped" in str(ex).lower():
-                self.logger.info("Extraction task stopped: %s", ex)
-            else:
-                self.logger.error("Extraction failed: %s", ex)
+        except TaskStoppedError as ex:
+            self.logger.info("Extraction task stopped: %s", ex)
+        except (OSError, RuntimeError) as ex:
+            self.logger.error("Extraction failed: %s", ex)
 
-    def _handle_runtime_error(self, ex: RuntimeError) -> None:
-        """Handle runtime errors (typically user-stopped tasks).
+    def _handle_task_stopped(self, ex: TaskStoppedError, device) -> None:
+        """Handle a task stopped by the user.
 
         Args:
-            ex: RuntimeError exception.
+            ex: TaskStoppedError exception.
+            device: ATDeviceInfo the task was for.
         """
-        if "stopped" in str(ex).lower():
-            self.logger.info("Task stopped: %s", ex)
-            self.ui_updater.update_status("Device connected")
-            self.ui_updater.update_progress_message("Task stopped", "warning")
-        else:
-            self.logger.error("Runtime error: %s", ex)
-            self.ui_updater.update_status("Device connected - Error")
-            self.ui_updater.update_progress_message("Waiting for device", "info")
+        self.logger.info("Task stopped: %s", ex)
+        self.download_in_progress = False
+        self.ui_updater.apply(
+            status=self._device_status(device, "Device connected"),
+            progress="Task stopped",
+            progress_color=COLOR_WARNING,
+            stop_button=(self.download_in_progress, False),
+        )
+
+    def _handle_runtime_error(self, ex: RuntimeError, device) -> None:
+        """Handle unexpected runtime errors.
 
+        Args:
+            ex: RuntimeError exception.
+            device: ATDeviceInfo the task was for.
+        """
+        self.logger.error("Runtime error: %s", ex)
         self.download_in_progress = False
-        self.ui_updater.update_stop_button_state(self.download_in_progress, False)
+        self.ui_updater.apply(
+            status=self._device_status(device, "Device connected - Error"),
+            progress="Waiting for device",
+            stop_button=(self.download_in_progress, False),
+        )
 
-    def _handle_fus_error(self, ex: InformError.BadStatus) -> None:
+    def _handle_fus_error(self, ex: InformError.BadStatus, device) -> None:
         """Handle FUS server errors.
 
         Args:
             ex: InformError.BadStatus exception.
+            device: ATDeviceInfo the task was for.
         """
-        status_msg = str(ex)
-        if "400" in status_msg:
-            msg = "Please update via OTA (Over-The-Air)"
-            self.logger.warning("FUS error 400: Firmware not available")
-            color = "warning"
-        elif "408" in status_msg:
-            msg = "Invalid model, CSC, or IMEI. Please check device information"
-            self.logger.error("FUS error 408: %s", msg)
-            color = "error"
-        else:
-            msg = f"FUS server error: {ex}"
+        entry = _FUS_STATUS_TABLE.get(ex.status_code)
+        if entry is None:
+            msg, color = f"FUS server error: {ex}", COLOR_ERROR
             self.logger.error(msg)
-            color = "error"
+        else:
+            msg, color, level = entry
+            self.logger.log(level, "FUS error %d: %s", ex.status_code, msg)
 
-        self.ui_updater.update_status("Device connected")
-        self.ui_updater.update_progress_message(msg, color)
         self.download_in_progress = False
-        self.ui_updater.update_stop_button_state(self.download_in_progress, False)
-
-    def _enter_download_mode_auto(self) -> None:
+        self.ui_updater.apply(
+            status=self._device_status(device, "Device connected"),
+            progress=msg,
+            progress_color=color,
+            stop_button=(self.download_in_progress, False),
+        )
+
+    def _enter_download_mode_auto(self, device) -> None:
         """Automatically enter download mode after firmware extraction.
 
         Sends AT+FUS? command and waits for device to appear in Odin mode.
-        Updates UI with progress messages during the transition.
-        """
-        try:
-            self.ui_updater.update_status("Device connected - Entering download mode")
-            self.ui_updater.update_progress_message("Sending download mode command...", "info")
+        Updates UI with progress messages during the transition. Skipped if the
+        device the firmware was downloaded for is no longer the one connected:
+        enter_odin_mode() auto-detects, so it would reboot whatever is plugged in.
 
-            def progress_cb(msg: str):
-                self.logger.info("Auto FUS Mode: %s", msg)
-                self.ui_updater.update_progress_message(msg, "info")
+        Args:
+            device: ATDeviceInfo the firmware was downloaded for.
+        """
 
-            # Attempt to enter Odin mode (auto-detects device)
-            success = enter_odin_mode(wait_timeout=30.0, progress_callback=progress_cb)
+        def progress_cb(msg: str):
+            self.logger.info("Auto FUS Mode: %s", msg)
+            self.ui_updater.update_progress_message(msg)
 
-            if success:
+        success = False
+        try:
+            # Hold the AT lock so the monitor loop does not probe the port mid-transition,
+            # and release the monitor's session: serial ports are exclusive on Windows
+            with self._at_lock:
+                try:
+                    present = self._probe_device_locked()
+                except DeviceError:
+                    present = None
+                same_device = present is not None and present.imei == device.imei
+                if same_device:
+                    self.ui_updater.apply(
+                        status="Device connected - Entering download mode", progress="Sending download mode command..."
+                    )
+                    self._close_at_session()
+                    # Attempt to enter Odin mode (auto-detects device)
+                    success = enter_odin_mode(wait_timeout=30.0, progress_callback=progress_cb)
+
+            if not same_device:
+                msg = "Device changed or disconnected - download mode skipped"
+                self.logger.warning("Auto FUS Mode: %s (%s)", msg, device.model)
+                self.ui_updater.update_progress_message(msg, COLOR_WARNING)
+            elif success:
                 msg = "Device successfully entered download mode! Ready for flashing"
                 self.logger.info(msg)
-                self.ui_updater.update_status("Device in download mode")
-                self.ui_updater.update_progress_message(msg, "success")
+                self.ui_updater.apply(status="Device in download mode", progress=msg, progress_color=COLOR_SUCCESS)
             else:
                 msg = "Timeout waiting for download mode. Device may not support AT+FUS? command"
                 self.logger.warning(msg)
-                self.ui_updater.update_status("Device connected")
-                self.ui_updater.update_progress_message(msg, "warning")
+                self.ui_updater.apply(status="Device connected", progress=msg, progress_color=COLOR_WARNING)
 
         except DeviceATError as ex:
             msg = f"Error entering download mode: {ex}"
             self.logger.error(msg)
-            self.ui_updater.update_status("Device connected - Download mode error")
-            self.ui_updater.update_progress_message(msg, "error")
+            self.ui_updater.apply(
+                status="Device connected - Download mode error", progress=msg, progress_color=COLOR_ERROR
+            )
 
-        except (OSError, IOError, ValueError, RuntimeError) as ex:
-            msg = f"Unexpected error during download mode transition: {ex}"
-            self.logger.error(msg)
-            self.ui_updater.update_status("Device connected - Error")
-            self.ui_updater.update_progress_message("Waiting for device", "info")
+        except (OSError, ValueError, RuntimeError) as ex:
+            self.logger.error("Unexpected error during download mode transition: %s", ex)
+            self.ui_updater.apply(status="Device connected - Error", progress="Waiting for device")
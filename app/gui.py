@@ -7,27 +7,76 @@ This module provides the main application window, coordinating UI components,
 device monitoring, and firmware operations.
 """
 
+import atexit
 import ctypes
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 import tempfile
 import threading
-import time
 import tkinter as tk
+from concurrent.futures import Future
 from importlib.resources import files
+from importlib.resources.abc import Traversable
 from typing import Optional
 
 import customtkinter as ctk
 
+from app.background import BackgroundWorker
 from app.config import load_config
 from app.device_monitor import DeviceMonitor
 from app.progress_tracker import ProgressTracker
 from app.ui_builder import UIBuilder
-from app.ui_updater import UIUpdater
+from app.ui_updater import COLOR_ERROR, CoalescedUpdate, UIUpdater, post_to_main
 from download import cleanup_repository, init_db
 from download.config import PATHS
 from download.service import get_session_id
 
+# Application log file in the data directory
+_LOG_FILE = PATHS.data_dir / "app.log"
+# Log format for the application log file
+_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+# Records buffered in memory until the log file is open
+_LOG_BUFFER_CAPACITY = 1000
+
+# Minimum interval between startup cleanup splash updates (milliseconds)
+_CLEANUP_UPDATE_MS = 100
+
+# Windows icon files tried first, in order of preference
+_ICO_ICON_NAMES = ("app_icon.ico",)
+# PNG icon sizes tried in order of preference
+_PNG_ICON_NAMES = ("256.png", "128.png", "64.png", "32.png")
+
+
+@functools.lru_cache(maxsize=1)
+def _icon_candidates(platform: str) -> tuple[Traversable, ...]:
+    """Return the existing AppIcons resources to try, in order (resolved once per process).
+
+    Prefers `.ico` files on Windows, then falls back to PNG sizes. Known file
+    names are checked directly; the directory is only listed if none exist.
+
+    Args:
+        platform: Value of sys.platform.
+
+    Returns:
+        Icon resources that exist, best candidate first (empty if AppIcons is unavailable).
+    """
+    try:
+        icons = files("AppIcons")
+        if not icons.is_dir():
+            return ()
+        suffixes = (".ico", ".png") if platform.startswith("win") else (".png",)
+        names = (_ICO_ICON_NAMES + _PNG_ICON_NAMES) if platform.startswith("win") else _PNG_ICON_NAMES
+        candidates = tuple(icons / name for name in names if (icons / name).is_file())
+        if not candidates:
+            # Renamed or repackaged icons: take whatever the directory holds
+            candidates = tuple(f for f in icons.iterdir() if f.name.endswith(suffixes))
+        return candidates
+    except (ImportError, OSError):
+        return ()
+
 
 class FirmwareDownloaderApp(ctk.CTk):
     """Main application window for Samsung Firmware Downloader.
@@ -38,17 +87,15 @@ class FirmwareDownloaderApp(ctk.CTk):
     Attributes:
         monitoring: Flag indicating if device monitoring is active.
         download_in_progress: Flag indicating if download is in progress.
-        stop_task: Flag to stop active download/decrypt/extract.
+        stop_event: Event set to stop active download/decrypt/extract.
+        closing: Set once the window is closing; worker-thread UI updates are dropped.
     """
 
     def __init__(self):
         """Initialize the application window."""
         super().__init__()
 
-        # Initialize database
-        init_db()
-
-        # Setup logging
+        # Setup logging (buffered; the database and log file are opened on the startup thread)
         self._setup_logging()
 
         # Log session ID from service
@@ -59,7 +106,8 @@ class FirmwareDownloaderApp(ctk.CTk):
 
         # Window configuration
         self.title("Samsung Firmware Downloader")
-        self._set_app_icon()
+        # Icon lookup and shell32 calls wait for the event loop so the splash shows first
+        self.after_idle(self._set_app_icon)
         self.geometry("1024x")
         self.minsize(1024, 0)
 
@@ -70,9 +118,17 @@ class FirmwareDownloaderApp(ctk.CTk):
         # State flags
         self.monitoring = False
         self.download_in_progress = False
-        self.stop_task = False
-        self.monitor_thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
         self.startup_cleanup_done = False
+        # Set by on_closing(); post_to_main() drops worker updates from then on
+        self.closing = False
+
+        # Background work (startup cleanup, device monitoring, firmware pipeline) shares one
+        # daemon worker; two threads so a firmware task can run alongside the monitor loop
+        self._worker = BackgroundWorker(max_workers=2, name="nanosamfw")
+        self._cleanup_future: Optional[Future] = None
+        self._monitor_future: Optional[Future] = None
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         # Initialize UI builder
         self.ui_builder = UIBuilder(self, self.config)
@@ -90,20 +146,17 @@ class FirmwareDownloaderApp(ctk.CTk):
         splash_widgets = self.ui_builder.create_splash_widgets()
         self.splash_widgets = splash_widgets
 
-        # Run cleanup in background thread to keep UI responsive
-        threading.Thread(target=self._perform_cleanup, daemon=True).start()
+        # Run cleanup in the background to keep UI responsive
+        self._cleanup_future = self._worker.submit(self._perform_cleanup)
+        self._cleanup_future.add_done_callback(self._on_cleanup_done)
 
     def _set_app_icon(self) -> None:
         """Configure the window/taskbar icon using importlib.resources.
 
         Prefers `.ico` on Windows, otherwise falls back to a PNG.
-        Uses importlib.resources for reliable packaging.
+        Candidate lookup is cached by _icon_candidates().
         """
         try:
-            icons = files('AppIcons') if files('AppIcons').is_dir() else None
-            if not icons:
-                return
-
             if sys.platform.startswith("win"):
                 # Help Windows taskbar use the same icon
                 try:
@@ -112,101 +165,124 @@ class FirmwareDownloaderApp(ctk.CTk):
                     # Ignore failure to set AppUserModelID; not critical for UI operation
                     pass
 
-                # Try app_icon.ico or any .ico
-                ico_candidates = ['app_icon.ico'] + [f.name for f in icons.iterdir() if f.name.endswith('.ico')]
-                for ico_name in ico_candidates:
-                    try:
-                        ico_data = (icons / ico_name).read_bytes()
+            for icon in _icon_candidates(sys.platform):
+                try:
+                    icon_data = icon.read_bytes()
+                    if icon.name.endswith(".ico"):
                         # iconbitmap needs a file path, write to temp
                         with tempfile.NamedTemporaryFile(suffix='.ico', delete=False) as tmp:
-                            tmp.write(ico_data)
+                            tmp.write(icon_data)
                             tmp_path = tmp.name
                         self.iconbitmap(default=tmp_path)
                         # Keep temp file reference for cleanup
                         self._icon_tmp = tmp_path  # type: ignore[attr-defined]
-                        return
-                    except (KeyError, FileNotFoundError, tk.TclError, OSError):
-                        continue
-
-            # Non-Windows or fallback: use PNG
-            png_candidates = ['256.png', '128.png', '64.png', '32.png']
-            for png_name in png_candidates:
-                try:
-                    png_data = (icons / png_name).read_bytes()
-                    img = tk.PhotoImage(data=png_data)
-                    self.iconphoto(True, img)
-                    self._icon_img = img  # type: ignore[attr-defined]
+                    else:
+                        img = tk.PhotoImage(data=icon_data)
+                        self.iconphoto(True, img)
+                        self._icon_img = img  # type: ignore[attr-defined]
                     return
                 except (KeyError, FileNotFoundError, tk.TclError, OSError):
                     continue
 
-        except (ImportError, tk.TclError, OSError, AttributeError):
+        except (tk.TclError, OSError, AttributeError):
             # Never block UI due to icon issues
             pass
 
+    def _on_cleanup_done(self, future: Future) -> None:
+        """Report a failed startup (database, log file or cleanup) on the splash screen.
+
+        Runs on the worker thread once _perform_cleanup() has finished.
+
+        Args:
+            future: Future of the _perform_cleanup() call.
+        """
+        # Cancelled when the window closes before the task started
+        ex = None if future.cancelled() else future.exception()
+        if ex is None:
+            return
+        self.logger.error("Startup failed: %s", ex, exc_info=ex)
+        post_to_main(self, 0, lambda: self.splash_widgets["cleanup_status"].configure(text=f"Startup failed: {ex}"))
+
     def _perform_cleanup(self) -> None:
         """Execute repository cleanup via download service and then build UI."""
+        # Only the latest record count reaches the splash, at most every 100 ms
+        cleanup_progress = CoalescedUpdate(self, self._show_cleanup_progress, delay_ms=_CLEANUP_UPDATE_MS)
 
-        def progress_cb(processed: int, total: int, missing: int, deleted: int, dec_deleted: int):
-            pct = processed / total if total else 1.0
-            self.after(0, lambda v=pct: self.splash_widgets["cleanup_progress"].set(v))
-            self.after(
-                0,
-                lambda: self.splash_widgets["cleanup_details"].configure(
-                    text=(
-                        f"Processed {processed}/{total} | Missing encrypted: {missing} | "
-                        f"Records deleted: {deleted} | Decrypted deleted: {dec_deleted}"
-                    )
-                ),
-            )
+        # Disk setup happens here, behind the splash, instead of before the window appears
+        post_to_main(self, 0, lambda: self.splash_widgets["cleanup_status"].configure(text="Opening database..."))
+        self._open_log_file()
+        init_db()
 
         # Start cleanup
-        self.after(0, lambda: self.splash_widgets["cleanup_status"].configure(text="Cleaning repository..."))
-        stats = cleanup_repository(progress_cb)
+        post_to_main(self, 0, lambda: self.splash_widgets["cleanup_status"].configure(text="Cleaning repository..."))
+        stats = cleanup_repository(cleanup_progress.post)
         summary = (
             f"Cleanup complete. Inspected: {stats['total_records']} | Missing: {stats['missing_encrypted']} | "
             f"Deleted: {stats['records_deleted']} | Decrypted removed: {stats['decrypted_deleted']}"
         )
-        self.after(0, lambda: self.splash_widgets["cleanup_status"].configure(text=summary))
-        self.after(0, lambda: self.splash_widgets["cleanup_progress"].set(1.0))
-        time.sleep(0.5)
-        self.after(0, self._finish_startup)
+        post_to_main(self, 0, lambda: self.splash_widgets["cleanup_status"].configure(text=summary))
+        post_to_main(self, 0, lambda: self.splash_widgets["cleanup_progress"].set(1.0))
+        # Leave the summary visible briefly without holding the worker thread
+        post_to_main(self, 500, self._finish_startup)
+
+    def _show_cleanup_progress(self, processed: int, total: int, missing: int, deleted: int, dec_deleted: int):
+        """Show cleanup progress on the splash screen (main thread only)."""
+        self.splash_widgets["cleanup_progress"].set(processed / total if total else 1.0)
+        self.splash_widgets["cleanup_details"].configure(
+            text=(
+                f"Processed {processed}/{total} | Missing encrypted: {missing} | "
+                f"Records deleted: {deleted} | Decrypted deleted: {dec_deleted}"
+            )
+        )
 
     def _finish_startup(self) -> None:
-        """Destroy splash and build main application widgets."""
-        if "splash_frame" in self.splash_widgets:
-            self.splash_widgets["splash_frame"].destroy()
+        """Hide splash, build main application widgets, then destroy the splash."""
+        splash_frame = self.splash_widgets.get("splash_frame")
+        if splash_frame is not None:
+            splash_frame.pack_forget()
         self._create_widgets()
+        if splash_frame is not None:
+            # Tear the hidden splash down after the main window has been drawn
+            self.after(500, splash_frame.destroy)
         self.startup_cleanup_done = True
         # Auto-start monitoring after UI is ready
         self.start_monitoring()
 
     def _setup_logging(self):
-        """Setup logging to file in data directory."""
-        log_dir = PATHS.data_dir
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / "app.log"
-
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.FileHandler(log_file, mode="a", encoding="utf-8"),
-            ],
-        )
+        """Setup logging, buffering records in memory until _open_log_file() runs.
+
+        No disk I/O happens here, so the window can appear before the data
+        directory and log file are touched.
+        """
+        self._log_buffer = logging.handlers.MemoryHandler(_LOG_BUFFER_CAPACITY, flushLevel=logging.CRITICAL + 1)
+        logging.basicConfig(level=logging.INFO, handlers=[self._log_buffer])
         self.logger = logging.getLogger(__name__)
         self.logger.info("=" * 60)
         self.logger.info("Application started")
 
-    def _log(self, level: str, message: str):
-        """Log message with timestamp.
+    def _open_log_file(self) -> None:
+        """Open the log file in the data directory and flush buffered records into it.
 
-        Args:
-            level: Log level (info, warning, error).
-            message: Message to log.
+        The file handler is driven by a QueueListener thread; loggers only enqueue
+        records, so download/decrypt threads never block on log file writes.
         """
-        log_func = getattr(self.logger, level, self.logger.info)
-        log_func(message)
+        _LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(_LOG_FILE, mode="a", encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+        log_queue: queue.Queue = queue.Queue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+        # Runs before logging's own shutdown hook (atexit is LIFO), draining the queue
+        atexit.register(self._log_listener.stop)
+
+        # Enqueue buffered records first, then swap handlers; close() flushes any stragglers
+        self._log_buffer.setTarget(queue_handler)
+        self._log_buffer.flush()
+        root_logger = logging.getLogger()
+        root_logger.addHandler(queue_handler)
+        root_logger.removeHandler(self._log_buffer)
+        self._log_buffer.close()
 
     def _create_widgets(self):
         """Create and layout all UI widgets."""
@@ -217,32 +293,19 @@ class FirmwareDownloaderApp(ctk.CTk):
         # Initialize UI updater with widget references
         self.ui_updater = UIUpdater(self, self.widgets)
 
-        # Initialize progress tracker
-        def progress_ui_callback(stage: str, done: int, total: int, label: str):
-            self.ui_updater.update_progress_bar(stage, done, total, label)
-
-        self.progress_tracker = ProgressTracker(progress_ui_callback)
+        # Initialize progress tracker (bound methods: no wrapper call per progress tick)
+        self.progress_tracker = ProgressTracker(self.ui_updater.update_progress_bar)
 
         # Initialize device monitor
-        def progress_callback(stage: str, done: int, total: int):
-            self.progress_tracker.update_progress(stage, done, total)
-
-        def stop_check() -> bool:
-            return self.stop_task
-
-        def disconnect_callback() -> None:
-            # Reset stop flag when device disconnects
-            self.stop_task = False
-
-        csc_filter_list = self._parse_csc_filter()
         self.device_monitor = DeviceMonitor(
             self.ui_updater,
-            progress_callback,
-            stop_check,
-            disconnect_callback=disconnect_callback,
-            csc_filter=csc_filter_list,
+            self.progress_tracker.update_progress,
+            self.stop_event.is_set,  # Bound C method, polled per I/O chunk
+            disconnect_callback=self.stop_event.clear,  # Reset stop flag when device disconnects
+            csc_filter=self.config.csc_filter_set,
             ignore_home_csc=self.config.ignore_home_csc,
             autofus_checkbox=self.widgets.get("autofus_checkbox"),
+            worker=self._worker,
         )
 
         # Set initial placeholders
@@ -253,33 +316,32 @@ class FirmwareDownloaderApp(ctk.CTk):
         if not self.monitoring:
             self.monitoring = True
             self.ui_updater.update_status("Monitoring for devices...")
-            self.ui_updater.update_progress_message("Waiting for device", "info")
-            self.monitor_thread = threading.Thread(target=self._run_monitor, daemon=True)
-            self.monitor_thread.start()
-
-    def _parse_csc_filter(self) -> list[str]:
-        """Parse CSC filter config into a list of uppercase codes.
+            self.ui_updater.update_progress_message("Waiting for device")
+            self._monitor_future = self._worker.submit(self.device_monitor.start)
+            self._monitor_future.add_done_callback(self._on_monitor_done)
 
-        Empty string = allow all devices
-        Comma-separated values = only allow those CSC codes
+    def _on_monitor_done(self, future: Future) -> None:
+        """Report device monitoring that ended with an error (runs on the worker thread).
 
-        Returns:
-            List of uppercase CSC codes to allow, or empty list to allow all.
+        Args:
+            future: Future of the DeviceMonitor.start() call.
         """
-        if not getattr(self.config, "csc_filter", ""):
-            return []
-        return [c.strip().upper() for c in self.config.csc_filter.split(",") if c.strip()]
-
-    def _run_monitor(self):
-        """Run device monitor in background thread."""
-        self.device_monitor.start()
+        # Cancelled when the window closes before the task started
+        ex = None if future.cancelled() else future.exception()
+        if ex is None:
+            return
+        self.logger.error("Device monitoring stopped: %s", ex, exc_info=ex)
+        self.monitoring = False
+        self.ui_updater.apply(
+            status=f"Device monitoring stopped: {ex}", progress="Monitoring stopped", progress_color=COLOR_ERROR
+        )
 
     def stop_monitoring(self):  # pragma: no cover
         """Stop device monitoring."""
         self.monitoring = False
         self.device_monitor.stop()
         self.ui_updater.update_status("Monitoring stopped")
-        self.ui_updater.update_progress_message("Monitoring stopped", "info")
+        self.ui_updater.update_progress_message("Monitoring stopped")
 
     def stop_current_task(self):
         """Stop any active download, decrypt, or extract task.
@@ -287,10 +349,27 @@ class FirmwareDownloaderApp(ctk.CTk):
         Device monitoring remains active. The stop flag is checked in download loops.
         """
         if self.device_monitor.download_in_progress:
-            self._log("info", "User requested task stop")
-            self.stop_task = True
+            self.logger.info("User requested task stop")
+            self.stop_event.set()
             self.ui_updater.update_status("Stopping task...")
 
+    def on_closing(self) -> None:
+        """Stop background work and close the window.
+
+        Sets the closing flag so late worker-thread UI updates are dropped, sets
+        the stop flag so an active download/decrypt/extract ends at its next
+        chunk, stops the device monitor and cancels queued background tasks. Worker
+        threads are daemons, so a task blocked in I/O does not keep the process
+        alive after the window closes.
+        """
+        self.closing = True
+        self.stop_event.set()
+        device_monitor = getattr(self, "device_monitor", None)
+        if device_monitor is not None:
+            device_monitor.stop()
+        self._worker.shutdown(cancel_futures=True)
+        self.destroy()
+
     def run(self):
         """Start the application main loop."""
         self.mainloop()
@@ -10,6 +10,29 @@ and throughput monitoring for download, decrypt, and extract operations.
 import time
 from typing import Callable
 
+# Bytes to megabytes
+_INV_MB = 1.0 / (1024 * 1024)
+# Label prefix for byte-counted stages
+_STAGE_PREFIX = {"download": "Downloading", "decrypt": "Decrypting"}
+# Minimum interval between UI updates (nanoseconds)
+_UPDATE_INTERVAL_NS = 100_000_000
+
+
+def _format_hms(sec: float) -> str:
+    """Format seconds as H:MM:SS, or M:SS under an hour.
+
+    Args:
+        sec: Number of seconds.
+
+    Returns:
+        Formatted duration string.
+    """
+    m, s = divmod(int(sec), 60)
+    h, m = divmod(m, 60)
+    if h:
+        return f"{h:d}:{m:02d}:{s:02d}"
+    return f"{m:d}:{s:02d}"
+
 
 class ProgressTracker:
     """Tracks progress for multi-stage firmware operations.
@@ -29,19 +52,23 @@ class ProgressTracker:
                 Signature: (stage: str, done: int, total: int, label: str) -> None
         """
         self.update_callback = update_callback
-        self._last_progress_time: float = 0.0
+        self._last_progress_time_ns = 0
         self._last_progress_pct: dict[str, float] = {
             "download": 0.0,
             "decrypt": 0.0,
             "extract": 0.0,
         }
-        self._stage_start_time: dict[str, float] = {}
+        self._stage_start_ns: dict[str, int] = {}
         self._stage_last_done: dict[str, int] = {}
+        # (stage, done in 0.1 MB units) of the last update, for byte-counted stages
+        self._last_mb_bucket: tuple[str, int] = ("", -1)
 
     def update_progress(self, stage: str, done: int, total: int) -> None:
         """Update progress for a specific stage.
 
-        Throttles updates to avoid overwhelming the UI. Updates are pushed when:
+        Throttles updates to avoid overwhelming the UI. Byte-counted stages are
+        skipped until at least 0.1 MB more has been processed; then updates are
+        pushed when:
         - Task completes (done >= total)
         - Progress changes by >= 1%
         - At least 100ms has elapsed since last update
@@ -51,9 +78,16 @@ class ProgressTracker:
             done: Bytes or files processed so far.
             total: Total bytes or files for stage.
         """
+        # Nothing visible changes below 0.1 MB: skip before any float or string work
+        if stage != "extract" and done < total:
+            bucket = (stage, int(done * _INV_MB * 10))
+            if bucket == self._last_mb_bucket:
+                return
+            self._last_mb_bucket = bucket
+
         # Throttle UI updates to avoid massive Tk event queue and slowdowns
-        now = time.monotonic()
-        last_time = self._last_progress_time
+        now_ns = time.monotonic_ns()
+        last_time_ns = self._last_progress_time_ns
         last_pct = self._last_progress_pct.get(stage, 0.0)
 
         pct = done / total if total > 0 else 0.0
@@ -63,38 +97,38 @@ class ProgressTracker:
         # - Completion
         # - Significant visual change (>= 1%)
         # - Or at least every 100ms
-        should_update = done >= total or pct_delta >= 0.01 or (now - last_time) >= 0.1
+        should_update = done >= total or pct_delta >= 0.01 or now_ns - last_time_ns >= _UPDATE_INTERVAL_NS
 
         if not should_update:
             return
 
         # Record last update markers
-        self._last_progress_time = now
+        self._last_progress_time_ns = now_ns
         self._last_progress_pct[stage] = pct
 
         # Initialize/reset per-stage timers if needed (new stage or restart)
         last_done = self._stage_last_done.get(stage, -1)
-        if stage not in self._stage_start_time or done < last_done:
-            self._stage_start_time[stage] = now
+        if stage not in self._stage_start_ns or done < last_done:
+            self._stage_start_ns[stage] = now_ns
         self._stage_last_done[stage] = done
 
-        mb_done = done / (1024 * 1024)
-        mb_total = total / (1024 * 1024)
-        elapsed = max(0.0, now - self._stage_start_time.get(stage, now))
+        mb_done = done * _INV_MB
+        mb_total = total * _INV_MB
+        elapsed = (now_ns - self._stage_start_ns[stage]) / 1e9
         speed_bps = (done / elapsed) if elapsed > 0.0 else 0.0
-        speed_mbps = speed_bps / (1024 * 1024)
+        speed_mbps = speed_bps * _INV_MB
 
         # Compute ETA based on current average speed
         eta_secs = ((total - done) / speed_bps) if (speed_bps > 0 and total > 0) else None
-        eta_str = self._format_eta(eta_secs)
-        elapsed_str = self._format_duration(elapsed)
+        eta_str = _format_hms(eta_secs) if eta_secs is not None else "--:--"
+        elapsed_str = _format_hms(elapsed)
 
         if stage == "extract":
             # Extract stage uses file count, not bytes
             prefix = "Extracting"
             label = f"{prefix}: {done} / {total} files • Elapsed {elapsed_str} • ETA {eta_str}"
         else:
-            prefix = "Downloading" if stage == "download" else "Decrypting"
+            prefix = _STAGE_PREFIX.get(stage, "Decrypting")
             if speed_mbps > 0:
                 label = (
                     f"{prefix}: {mb_done:.1f} MB / {mb_total:.1f} MB • "
@@ -108,47 +142,12 @@ class ProgressTracker:
 
     def reset(self) -> None:
         """Reset all progress state for new operation."""
-        self._last_progress_time = 0.0
+        self._last_progress_time_ns = 0
         self._last_progress_pct = {
             "download": 0.0,
             "decrypt": 0.0,
             "extract": 0.0,
         }
-        self._stage_start_time.clear()
+        self._stage_start_ns.clear()
         self._stage_last_done.clear()
-
-    @staticmethod
-    def _format_eta(sec: float | None) -> str:
-        """Format ETA seconds as HH:MM:SS or MM:SS.
-
-        Args:
-            sec: Seconds remaining, or None if unknown.
-
-        Returns:
-            Formatted ETA string or "--:--" if unknown.
-        """
-        if sec is None:
-            return "--:--"
-        sec_i = int(sec)
-        h, r = divmod(sec_i, 3600)
-        m, s = divmod(r, 60)
-        if h:
-            return f"{h:d}:{m:02d}:{s:02d}"
-        return f"{m:d}:{s:02d}"
-
-    @staticmethod
-    def _format_duration(sec: float) -> str:
-        """Format elapsed seconds as HH:MM:SS or MM:SS.
-
-        Args:
-            sec: Elapsed seconds.
-
-        Returns:
-            Formatted duration string.
-        """
-        sec_i = int(sec)
-        h, r = divmod(sec_i, 3600)
-        m, s = divmod(r, 60)
-        if h:
-            return f"{h:d}:{m:02d}:{s:02d}"
-        return f"{m:d}:{s:02d}"
+        self._last_mb_bucket = ("", -1)
@@ -8,10 +8,10 @@ configuration using customtkinter.
 """
 
 import logging
+import tkinter as tk
 from collections.abc import Callable
 
 import customtkinter as ctk
-import pyperclip
 
 from app.config import AppConfig
 
@@ -35,6 +35,22 @@ class UIBuilder:
         self.root = root
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self._fonts: dict[tuple[int, str], ctk.CTkFont] = {}
+
+    def _font(self, size: int, weight: str = "normal") -> ctk.CTkFont:
+        """Return the shared font for (size, weight), creating it on first use.
+
+        Args:
+            size: Font size.
+            weight: Font weight ("normal" or "bold").
+
+        Returns:
+            Font instance shared by every widget using the same size and weight.
+        """
+        font = self._fonts.get((size, weight))
+        if font is None:
+            font = self._fonts[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+        return font
 
     def create_main_widgets(self, stop_callback: Callable[[], None]) -> dict:
         """Create and layout all main application widgets.
@@ -78,17 +94,14 @@ class UIBuilder:
         status_frame = ctk.CTkFrame(parent)
         status_frame.pack(fill="x", padx=5, pady=5)
 
-        ctk.CTkLabel(status_frame, text="Status:", font=ctk.CTkFont(size=14, weight="bold")).pack(
-            anchor="w", padx=10, pady=(10, 5)
-        )
+        ctk.CTkLabel(status_frame, text="Status:", font=self._font(14, "bold")).pack(anchor="w", padx=10, pady=(10, 5))
 
-        status_label = ctk.CTkLabel(
-            status_frame,
-            text="Stopped. Press 'Start Monitoring' to begin device detection",
-            font=ctk.CTkFont(size=12),
-        )
+        # Bound variable: status updates are a single set() instead of a widget reconfigure
+        status_var = tk.StringVar(master=self.root, value="Stopped. Press 'Start Monitoring' to begin device detection")
+        status_label = ctk.CTkLabel(status_frame, textvariable=status_var, font=self._font(12))
         status_label.pack(anchor="w", padx=10, pady=(0, 10))
         widgets["status_label"] = status_label
+        widgets["status_var"] = status_var
 
     def _create_device_info_frame(self, parent, widgets: dict) -> None:
         """Create device information frame with entries.
@@ -100,7 +113,7 @@ class UIBuilder:
         device_frame = ctk.CTkFrame(parent)
         device_frame.pack(fill="x", padx=5, pady=(0, 5))
 
-        ctk.CTkLabel(device_frame, text="Device Information:", font=ctk.CTkFont(size=14, weight="bold")).pack(
+        ctk.CTkLabel(device_frame, text="Device Information:", font=self._font(14, "bold")).pack(
             anchor="w", padx=10, pady=(10, 5)
         )
 
@@ -108,35 +121,35 @@ class UIBuilder:
         entries_frame = ctk.CTkFrame(device_frame)
         entries_frame.pack(fill="x", padx=10, pady=(0, 10))
 
-        def _make_full_row(row: int, label: str) -> ctk.CTkEntry:
-            ctk.CTkLabel(entries_frame, text=label, font=ctk.CTkFont(size=12, weight="bold")).grid(
+        def _make_full_row(row: int, label: str) -> tuple[ctk.CTkEntry, tk.StringVar]:
+            ctk.CTkLabel(entries_frame, text=label, font=self._font(12, "bold")).grid(
                 row=row, column=0, sticky="w", padx=4, pady=4
             )
-            entry = ctk.CTkEntry(entries_frame, font=ctk.CTkFont(size=12))
+            var = tk.StringVar(master=self.root)
+            entry = ctk.CTkEntry(entries_frame, textvariable=var, font=self._font(12), state="disabled")
             entry.grid(row=row, column=1, columnspan=5, sticky="ew", padx=(10, 4), pady=4)
-            entry.configure(state="disabled")
-            return entry
+            return entry, var
 
-        def _make_col(row: int, col: int, label: str) -> ctk.CTkEntry:
-            ctk.CTkLabel(entries_frame, text=label, font=ctk.CTkFont(size=12, weight="bold")).grid(
+        def _make_col(row: int, col: int, label: str) -> tuple[ctk.CTkEntry, tk.StringVar]:
+            ctk.CTkLabel(entries_frame, text=label, font=self._font(12, "bold")).grid(
                 row=row, column=col * 2, sticky="w", pady=4, padx=(10, 0) if col > 0 else 4
             )
-            entry = ctk.CTkEntry(entries_frame, font=ctk.CTkFont(size=12))
+            var = tk.StringVar(master=self.root)
+            entry = ctk.CTkEntry(entries_frame, textvariable=var, font=self._font(12), state="disabled")
             entry.grid(row=row, column=col * 2 + 1, sticky="ew", padx=(10, 4), pady=4)
-            entry.configure(state="disabled")
-            return entry
+            return entry, var
 
         # Configure columns for equal width
         entries_frame.grid_columnconfigure(1, weight=1)
         entries_frame.grid_columnconfigure(3, weight=1)
         entries_frame.grid_columnconfigure(5, weight=1)
 
-        widgets["model_entry"] = _make_full_row(0, "Model")
-        widgets["firmware_entry"] = _make_full_row(1, "Firmware")
-        widgets["region_entry"] = _make_col(2, 0, "Region/CSC")
-        widgets["aid_entry"] = _make_col(2, 1, "AID")
-        widgets["cc_entry"] = _make_col(2, 2, "CC")
-        widgets["imei_entry"] = _make_full_row(3, "IMEI")
+        widgets["model_entry"], widgets["model_var"] = _make_full_row(0, "Model")
+        widgets["firmware_entry"], widgets["firmware_var"] = _make_full_row(1, "Firmware")
+        widgets["region_entry"], widgets["region_var"] = _make_col(2, 0, "Region/CSC")
+        widgets["aid_entry"], widgets["aid_var"] = _make_col(2, 1, "AID")
+        widgets["cc_entry"], widgets["cc_var"] = _make_col(2, 2, "CC")
+        widgets["imei_entry"], widgets["imei_var"] = _make_full_row(3, "IMEI")
 
     def _create_progress_frame(self, parent, widgets: dict, stop_callback) -> None:
         """Create progress display frame.
@@ -149,7 +162,7 @@ class UIBuilder:
         progress_frame = ctk.CTkFrame(parent)
         progress_frame.pack(fill="x", padx=5, pady=(0, 5))
 
-        ctk.CTkLabel(progress_frame, text="Progress:", font=ctk.CTkFont(size=14, weight="bold")).pack(
+        ctk.CTkLabel(progress_frame, text="Progress:", font=self._font(14, "bold")).pack(
             anchor="w", padx=10, pady=(10, 5)
         )
 
@@ -168,7 +181,7 @@ class UIBuilder:
         download_progress_bar.set(0)
         widgets["download_progress_bar"] = download_progress_bar
 
-        download_progress_label = ctk.CTkLabel(progress_bar_frame, text="", font=ctk.CTkFont(size=11))
+        download_progress_label = ctk.CTkLabel(progress_bar_frame, text="", font=self._font(11))
         download_progress_label.pack(anchor="w")
         widgets["download_progress_label"] = download_progress_label
 
@@ -176,7 +189,7 @@ class UIBuilder:
         stop_button = ctk.CTkButton(
             progress_bar_container,
             text="Stop Task",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold"),
             fg_color="#FF453A",
             hover_color="#E0342F",
             command=stop_callback,
@@ -190,7 +203,7 @@ class UIBuilder:
         progress_message = ctk.CTkLabel(
             progress_frame,
             text="Waiting for device",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
             fg_color=("#3B8ED0", "#1F6AA5"),
             corner_radius=8,
             height=40,
@@ -208,7 +221,7 @@ class UIBuilder:
         components_frame = ctk.CTkFrame(parent)
         components_frame.pack(fill="x", padx=5, pady=(0, 5))
 
-        ctk.CTkLabel(components_frame, text="Firmware Components:", font=ctk.CTkFont(size=14, weight="bold")).pack(
+        ctk.CTkLabel(components_frame, text="Firmware Components:", font=self._font(14, "bold")).pack(
             anchor="w", padx=10, pady=(10, 5)
         )
 
@@ -216,31 +229,33 @@ class UIBuilder:
         comp_entries_frame = ctk.CTkFrame(components_frame)
         comp_entries_frame.pack(fill="x", padx=10, pady=(0, 10))
 
-        def _make_comp_row(row: int, label: str, *, hidden: bool = False) -> ctk.CTkEntry:
+        def _make_comp_row(row: int, label: str, *, hidden: bool = False) -> tuple[ctk.CTkEntry, tk.StringVar]:
             label_widget = ctk.CTkLabel(
                 comp_entries_frame,
                 text=label,
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self._font(12, "bold"),
                 cursor="hand2" if not hidden else "",
             )
             label_widget.grid(row=row, column=0, sticky="w", padx=4, pady=4)
-            entry = ctk.CTkEntry(comp_entries_frame, font=ctk.CTkFont(size=11))
+            var = tk.StringVar(master=self.root)
+            entry = ctk.CTkEntry(comp_entries_frame, textvariable=var, font=self._font(11), state="disabled")
             entry.grid(row=row, column=1, sticky="ew", padx=(10, 4), pady=4)
             comp_entries_frame.grid_columnconfigure(1, weight=1)
-            entry.configure(state="disabled")
             original_fg = entry.cget("fg_color")
 
             # Make label clickable to copy entry value to clipboard
             def _copy_to_clipboard(_e):
-                value = entry.get()
+                value = var.get()
                 if value and value != "-":
                     try:
-                        pyperclip.copy(value)
+                        # Tk's own clipboard: no helper process (xclip/xsel) per click
+                        self.root.clipboard_clear()
+                        self.root.clipboard_append(value)
                         self.logger.info("Copied %s path to clipboard: %s", label, value)
                         # Brief visual feedback
                         entry.configure(fg_color="#2CC985")
                         self.root.after(1000, lambda: entry.configure(fg_color=original_fg))
-                    except (OSError, RuntimeError) as ex:
+                    except tk.TclError as ex:
                         self.logger.error("Failed to copy to clipboard: %s", ex)
 
             if not hidden:
@@ -251,13 +266,13 @@ class UIBuilder:
                 label_widget.grid_remove()
                 entry.grid_remove()
 
-            return entry
+            return entry, var
 
-        widgets["ap_entry"] = _make_comp_row(0, "BL")
-        widgets["bl_entry"] = _make_comp_row(1, "AP")
-        widgets["cp_entry"] = _make_comp_row(2, "CP")
-        widgets["csc_entry"] = _make_comp_row(3, "CSC")
-        widgets["home_entry"] = _make_comp_row(4, "HOME", hidden=True)
+        widgets["ap_entry"], widgets["ap_var"] = _make_comp_row(0, "BL")
+        widgets["bl_entry"], widgets["bl_var"] = _make_comp_row(1, "AP")
+        widgets["cp_entry"], widgets["cp_var"] = _make_comp_row(2, "CP")
+        widgets["csc_entry"], widgets["csc_var"] = _make_comp_row(3, "CSC")
+        widgets["home_entry"], widgets["home_var"] = _make_comp_row(4, "HOME", hidden=True)
 
     def _create_settings_frame(self, parent, widgets: dict) -> None:
         """Create settings frame with checkboxes.
@@ -277,7 +292,7 @@ class UIBuilder:
         dryrun_checkbox = ctk.CTkCheckBox(
             settings_container,
             text="Dry run",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
         )
         if not self.config.btn_dryrun:
             dryrun_checkbox.configure(state="disabled")
@@ -288,7 +303,7 @@ class UIBuilder:
         autofus_checkbox = ctk.CTkCheckBox(
             settings_container,
             text="Auto FUS Mode",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
         )
         if self.config.auto_fusmode:
             autofus_checkbox.select()
@@ -303,7 +318,7 @@ class UIBuilder:
         csc_filter_label = ctk.CTkLabel(
             settings_container,
             text=csc_label_text,
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
         )
         csc_filter_label.pack(side="left", padx=(0, 20))
         widgets["csc_filter_label"] = csc_filter_label
@@ -323,14 +338,14 @@ class UIBuilder:
         title = ctk.CTkLabel(
             splash_frame,
             text="Initializing Repository",
-            font=ctk.CTkFont(size=26, weight="bold"),
+            font=self._font(26, "bold"),
         )
         title.pack(pady=(0, 30))
 
         cleanup_status = ctk.CTkLabel(
             splash_frame,
             text="Scanning firmware records...",
-            font=ctk.CTkFont(size=14),
+            font=self._font(14),
             justify="left",
         )
         cleanup_status.pack(fill="x", pady=(0, 20))
@@ -344,7 +359,7 @@ class UIBuilder:
         cleanup_details = ctk.CTkLabel(
             splash_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             justify="left",
         )
         cleanup_details.pack(fill="x", pady=(0, 10))
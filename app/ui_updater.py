@@ -8,14 +8,101 @@ threads using Tkinter's after() mechanism for thread safety.
 """
 
 import logging
+import os
+import threading
+import tkinter as tk
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-import customtkinter as ctk
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from tkinter import Tk
 
+# Progress message colors (light, dark)
+COLOR_INFO = ("#3B8ED0", "#1F6AA5")
+COLOR_SUCCESS = ("#2CC985", "#2FA572")
+COLOR_WARNING = ("#FF9500", "#E68600")
+COLOR_ERROR = ("#FF453A", "#E0342F")
+
+# Firmware component file name prefixes, in match order
+_COMPONENT_PREFIXES = ("AP", "BL", "CP", "CSC", "HOME")
+
+# Delay before a coalesced update is applied on the main thread (~20 updates/s)
+_COALESCE_DELAY_MS = 50
+
+
+def post_to_main(root: "Tk", delay_ms: int, func: Callable[..., object], *args) -> None:
+    """Schedule func(*args) on the main thread with root.after() (any thread).
+
+    Worker threads are daemons and may still report after the window has been
+    destroyed; once the root's ``closing`` flag is set (see
+    FirmwareDownloaderApp.on_closing), updates are dropped instead of raising
+    on the worker thread.
+
+    Args:
+        root: Root Tkinter window for after() scheduling.
+        delay_ms: Delay before func runs (milliseconds).
+        func: Function to run on the main thread.
+        *args: Positional arguments passed to func.
+    """
+    if getattr(root, "closing", False):
+        return
+    try:
+        root.after(delay_ms, func, *args)
+    except (RuntimeError, tk.TclError):
+        # The window was destroyed between the flag check and the call
+        if not getattr(root, "closing", False):
+            raise
+
+
+class CoalescedUpdate:
+    """Latest-value-wins bridge from worker threads to a main-thread callback.
+
+    post() only stores its arguments; the first post after a flush schedules a
+    single after() callback that applies the most recent arguments. A burst of
+    updates therefore costs one Tk event instead of one per call, and no backlog
+    can build up in the Tk event queue.
+
+    Attributes:
+        root: Root Tkinter window for scheduling updates.
+    """
+
+    def __init__(self, root: "Tk", apply: Callable[..., None], delay_ms: int = _COALESCE_DELAY_MS):
+        """Initialize the coalesced update.
+
+        Args:
+            root: Root Tkinter window for after() scheduling.
+            apply: Function applied on the main thread with the latest posted arguments.
+            delay_ms: Delay between the first post and the flush (milliseconds).
+        """
+        self.root = root
+        self._apply = apply
+        self._delay_ms = delay_ms
+        self._lock = threading.Lock()
+        self._pending: tuple | None = None
+        self._scheduled = False
+
+    def post(self, *args) -> None:
+        """Store the latest arguments and schedule a flush if none is pending (any thread)."""
+        with self._lock:
+            self._pending = args
+            if self._scheduled:
+                return
+            self._scheduled = True
+        post_to_main(self.root, self._delay_ms, self._flush)
+
+    def discard(self) -> None:
+        """Drop the pending value so a scheduled flush applies nothing (any thread)."""
+        with self._lock:
+            self._pending = None
+
+    def _flush(self) -> None:
+        """Apply the latest posted arguments (main thread only)."""
+        with self._lock:
+            args, self._pending = self._pending, None
+            self._scheduled = False
+        if args is not None:
+            self._apply(*args)
+
 
 class UIUpdater:
     """Manages thread-safe updates to UI widgets.
@@ -39,6 +126,9 @@ class UIUpdater:
         self.root = root
         self.widgets = widgets
         self.logger = logging.getLogger(__name__)
+        self._progress_bar = CoalescedUpdate(root, self._show_progress_bar)
+        # Whether the progress bar (rather than the progress message) is packed; main thread only
+        self._progress_visible = False
 
     def update_status(self, message: str) -> None:
         """Update status label with thread-safe scheduling.
@@ -46,7 +136,7 @@ class UIUpdater:
         Args:
             message: Status message to display.
         """
-        self.root.after(0, lambda: self.widgets["status_label"].configure(text=message))
+        post_to_main(self.root, 0, self.widgets["status_var"].set, message)
 
     def update_device_fields(
         self, model: str, firmware: str, region: str, imei: str, aid: str = "-", cc: str = "-"
@@ -62,57 +152,40 @@ class UIUpdater:
             cc: Country Code.
         """
 
-        def _set(e: ctk.CTkEntry, text: str):
-            e.configure(state="normal")
-            e.delete(0, "end")
-            e.insert(0, text)
-            e.configure(state="disabled")
-
         def _update():
-            _set(self.widgets["model_entry"], model or "-")
-            _set(self.widgets["firmware_entry"], firmware or "-")
-            _set(self.widgets["region_entry"], region or "-")
-            _set(self.widgets["aid_entry"], aid or "-")
-            _set(self.widgets["cc_entry"], cc or "-")
-            _set(self.widgets["imei_entry"], imei or "-")
+            self.widgets["model_var"].set(model or "-")
+            self.widgets["firmware_var"].set(firmware or "-")
+            self.widgets["region_var"].set(region or "-")
+            self.widgets["aid_var"].set(aid or "-")
+            self.widgets["cc_var"].set(cc or "-")
+            self.widgets["imei_var"].set(imei or "-")
 
-        self.root.after(0, _update)
+        post_to_main(self.root, 0, _update)
 
     def set_device_placeholders(self) -> None:
         """Set placeholder text for device fields (no device detected)."""
 
-        def _set(e: ctk.CTkEntry, text: str):
-            e.configure(state="normal")
-            e.delete(0, "end")
-            e.insert(0, text)
-            e.configure(state="disabled")
-
         def _update():
-            _set(self.widgets["model_entry"], "-")
-            _set(self.widgets["firmware_entry"], "-")
-            _set(self.widgets["region_entry"], "-")
-            _set(self.widgets["aid_entry"], "-")
-            _set(self.widgets["cc_entry"], "-")
-            _set(self.widgets["imei_entry"], "-")
+            self.widgets["model_var"].set("-")
+            self.widgets["firmware_var"].set("-")
+            self.widgets["region_var"].set("-")
+            self.widgets["aid_var"].set("-")
+            self.widgets["cc_var"].set("-")
+            self.widgets["imei_var"].set("-")
 
-        self.root.after(0, _update)
+        post_to_main(self.root, 0, _update)
 
     def clear_component_entries(self) -> None:
         """Clear all firmware component entries."""
 
-        def _clear(e: ctk.CTkEntry):
-            e.configure(state="normal")
-            e.delete(0, "end")
-            e.configure(state="disabled")
-
         def _update():
-            _clear(self.widgets["ap_entry"])
-            _clear(self.widgets["bl_entry"])
-            _clear(self.widgets["cp_entry"])
-            _clear(self.widgets["csc_entry"])
-            _clear(self.widgets["home_entry"])
+            self.widgets["ap_var"].set("")
+            self.widgets["bl_var"].set("")
+            self.widgets["cp_var"].set("")
+            self.widgets["csc_var"].set("")
+            self.widgets["home_var"].set("")
 
-        self.root.after(0, _update)
+        post_to_main(self.root, 0, _update)
 
     def populate_component_entries(self, unzip_dir: Path, ignore_home_csc: bool = False) -> None:
         """Populate firmware component entries from unzipped directory.
@@ -122,42 +195,40 @@ class UIUpdater:
             ignore_home_csc: If True, don't display HOME_CSC component in UI.
         """
 
-        def _set(e: ctk.CTkEntry, text: str):
-            e.configure(state="normal")
-            e.delete(0, "end")
-            e.insert(0, text)
-            e.configure(state="disabled")
-
-        # Find files by prefix
-        components: dict[str, str | None] = {
-            "AP": None,
-            "BL": None,
-            "CP": None,
-            "CSC": None,
-            "HOME": None,
-        }
-        for file_path in unzip_dir.iterdir():
-            if file_path.is_file():
-                name = file_path.name
-                for prefix in components:
+        # Find files by prefix; with several per prefix the last by name wins, whatever the directory order
+        found: dict[str, os.DirEntry] = {}
+        # Resolve the directory once; component paths are joined onto it
+        with os.scandir(unzip_dir.resolve()) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(_COMPONENT_PREFIXES) or not entry.is_file():
+                    continue
+                for prefix in _COMPONENT_PREFIXES:
                     if name.startswith(prefix):
-                        components[prefix] = str(file_path.resolve())
+                        if prefix not in found or name > found[prefix].name:
+                            found[prefix] = entry
                         break
+        # Symlinked components are shown by their target, as resolve() did
+        components: dict[str, str | None] = dict.fromkeys(_COMPONENT_PREFIXES)
+        for prefix, entry in found.items():
+            components[prefix] = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
 
         def _update():
-            _set(self.widgets["ap_entry"], components["AP"] or "-")
-            _set(self.widgets["bl_entry"], components["BL"] or "-")
-            _set(self.widgets["cp_entry"], components["CP"] or "-")
-            _set(self.widgets["csc_entry"], components["CSC"] or "-")
+            self.widgets["ap_var"].set(components["AP"] or "-")
+            self.widgets["bl_var"].set(components["BL"] or "-")
+            self.widgets["cp_var"].set(components["CP"] or "-")
+            self.widgets["csc_var"].set(components["CSC"] or "-")
             # Show HOME_CSC unless explicitly ignored
             home_value = "-" if ignore_home_csc else (components["HOME"] or "-")
-            _set(self.widgets["home_entry"], home_value)
+            self.widgets["home_var"].set(home_value)
 
-        self.root.after(0, _update)
+        post_to_main(self.root, 0, _update)
 
     def update_progress_bar(self, stage: str, done: int, total: int, label: str) -> None:
         """Update progress bar and label.
 
+        Updates are coalesced: only the latest value is applied, at most every 50 ms.
+
         Args:
             stage: Stage name ("download", "decrypt", or "extract").
             done: Bytes or files processed.
@@ -166,37 +237,16 @@ class UIUpdater:
         """
         pct = done / total if total > 0 else 0.0
         self.logger.debug("Progress update - stage: %s, %.1f%% (%d/%d)", stage, pct * 100, done, total)
+        self._progress_bar.post(pct, label)
 
-        def _update():
-            self.widgets["progress_message"].pack_forget()
-            if not self.widgets["progress_bar_container"].winfo_ismapped():
-                self.widgets["progress_bar_container"].pack(fill="x", padx=10, pady=(0, 10))
-            self.widgets["download_progress_bar"].set(pct)
-            self.widgets["download_progress_label"].configure(text=label)
-
-        self.root.after(0, _update)
-
-    def update_progress_message(self, message: str, color: str = "info") -> None:
+    def update_progress_message(self, message: str, color: tuple[str, str] = COLOR_INFO) -> None:
         """Update progress message with color coding.
 
         Args:
             message: Message to display.
-            color: Color type - "info", "success", "warning", "error".
+            color: (light, dark) color - COLOR_INFO, COLOR_SUCCESS, COLOR_WARNING or COLOR_ERROR.
         """
-        colors = {
-            "info": ("#3B8ED0", "#1F6AA5"),
-            "success": ("#2CC985", "#2FA572"),
-            "warning": ("#FF9500", "#E68600"),
-            "error": ("#FF453A", "#E0342F"),
-        }
-        fg_color = colors.get(color, colors["info"])
-
-        def _update():
-            self.widgets["progress_bar_container"].pack_forget()
-            self.widgets["progress_message"].pack(fill="x", padx=10, pady=(0, 10))
-            self.widgets["progress_message"].configure(text=message, fg_color=fg_color)
-
-        self.root.after(0, _update)
+        post_to_main(self.root, 0, self._show_progress_message, message, color)
 
     def update_stop_button_state(self, download_in_progress: bool, stop_task: bool) -> None:
         """Update stop button enabled/disabled state.
@@ -205,14 +255,67 @@ class UIUpdater:
             download_in_progress: Whether download is active.
             stop_task: Whether stop has been requested.
         """
+        post_to_main(self.root, 0, self._set_stop_button, download_in_progress, stop_task)
+
+    def apply(
+        self,
+        *,
+        status: str | None = None,
+        progress: str | None = None,
+        progress_color: tuple[str, str] = COLOR_INFO,
+        stop_button: tuple[bool, bool] | None = None,
+    ) -> None:
+        """Apply several UI changes with a single main-thread post.
+
+        Equivalent to calling update_status(), update_progress_message() and
+        update_stop_button_state() in sequence, but schedules one after() callback.
+
+        Args:
+            status: Status message to display, or None to leave unchanged.
+            progress: Progress message to display, or None to leave unchanged.
+            progress_color: (light, dark) color for the progress message.
+            stop_button: (download_in_progress, stop_task) for the stop button, or None.
+        """
 
         def _update():
-            if download_in_progress and not stop_task:
-                self.widgets["stop_button"].configure(state="normal")
-            else:
-                self.widgets["stop_button"].configure(state="disabled")
+            if status is not None:
+                self._set_status(status)
+            if progress is not None:
+                self._show_progress_message(progress, progress_color)
+            if stop_button is not None:
+                self._set_stop_button(*stop_button)
+
+        post_to_main(self.root, 0, _update)
+
+    def _set_status(self, message: str) -> None:
+        """Set status label text (main thread only)."""
+        self.widgets["status_var"].set(message)
+
+    def _show_progress_bar(self, pct: float, label: str) -> None:
+        """Show the progress bar in place of the progress message (main thread only)."""
+        if not self._progress_visible:
+            self.widgets["progress_message"].pack_forget()
+            self.widgets["progress_bar_container"].pack(fill="x", padx=10, pady=(0, 10))
+            self._progress_visible = True
+        self.widgets["download_progress_bar"].set(pct)
+        self.widgets["download_progress_label"].configure(text=label)
+
+    def _show_progress_message(self, message: str, color: tuple[str, str]) -> None:
+        """Show the progress message in place of the progress bar (main thread only)."""
+        # A progress value still pending must not bring the bar back over this message
+        self._progress_bar.discard()
+        if self._progress_visible:
+            self.widgets["progress_bar_container"].pack_forget()
+            self.widgets["progress_message"].pack(fill="x", padx=10, pady=(0, 10))
+            self._progress_visible = False
+        self.widgets["progress_message"].configure(text=message, fg_color=color)
 
-        self.root.after(0, _update)
+    def _set_stop_button(self, download_in_progress: bool, stop_task: bool) -> None:
+        """Enable the stop button only while a task runs and no stop is pending (main thread only)."""
+        if download_in_progress and not stop_task:
+            self.widgets["stop_button"].configure(state="normal")
+        else:
+            self.widgets["stop_button"].configure(state="disabled")
 
     def update_cleanup_status(self, status: str, progress: float, details: str) -> None:
         """Update cleanup status during startup.
@@ -231,4 +334,4 @@ class UIUpdater:
             if "cleanup_details" in self.widgets:
                 self.widgets["cleanup_details"].configure(text=details)
 
-        self.root.after(0, _update)
+        post_to_main(self.root, 0, _update)
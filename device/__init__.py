@@ -91,10 +91,11 @@ Copyright (c) 2024 nanosamfw contributors
 SPDX-License-Identifier: MIT
 """
 
-from device.at_client import ATDeviceInfo, enter_download_mode, read_device_info_at, send_at_command
+from device.at_client import ATDeviceInfo, ATSession, enter_download_mode, read_device_info_at, send_at_command
 from device.detector import DetectedDevice, detect_samsung_devices, get_first_device
 from device.device_command import enter_odin_mode
 from device.errors import DeviceATError, DeviceError, DeviceNotFoundError, DeviceOdinError
+from device.hotplug import HotplugWatcher
 from device.odin_client import (
     DVIF_COMMAND,
     LOKE_RESPONSE,
@@ -118,6 +119,9 @@ __all__ = [
     "read_device_info_at",
     "send_at_command",
     "enter_download_mode",
+    "ATSession",  # Persistent AT connection
+    # USB hotplug notifications
+    "HotplugWatcher",
     # Models
     "OdinDeviceInfo",  # Odin protocol result
     "ATDeviceInfo",  # AT command result
@@ -43,6 +43,68 @@ class ATDeviceInfo:
     cc: str = ""
 
 
+def _open_port(port_name: str, timeout: float) -> serial.Serial:
+    """Open a Samsung modem serial port with AT settings (115200 8N1)."""
+    return serial.Serial(
+        port=port_name,
+        baudrate=115200,
+        bytesize=serial.EIGHTBITS,
+        parity=serial.PARITY_NONE,
+        stopbits=serial.STOPBITS_ONE,
+        timeout=timeout,
+        write_timeout=timeout,
+    )
+
+
+def _exchange(
+    port: serial.Serial,
+    port_name: str,
+    command: str,
+    *,
+    timeout: float,
+    encoding: str,
+    expect_ok: bool,
+) -> str:
+    """Write an AT command on an open port and collect the response until timeout.
+
+    Raises:
+        DeviceATError: On write timeout, empty response, or missing OK when expected.
+        serial.SerialException: On other serial failures (mapped by callers).
+    """
+    cmd_bytes = command.encode(encoding)
+    if not cmd_bytes.endswith(b"\r\n"):
+        cmd_bytes += b"\r\n"
+
+    # Clear buffers
+    port.reset_input_buffer()
+    port.reset_output_buffer()
+
+    # Write command
+    try:
+        port.write(cmd_bytes)
+        port.flush()
+    except serial.SerialTimeoutException as ex:
+        raise DeviceATError(f"Write timeout on {port_name}: {ex}.") from ex
+
+    # Read until timeout
+    response_parts: list[str] = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        waiting = port.in_waiting
+        if waiting:
+            chunk = port.read(waiting)
+            response_parts.append(chunk.decode(encoding, errors="replace"))
+        else:
+            time.sleep(0.05)
+
+    response = "".join(response_parts).strip()
+    if not response:
+        raise DeviceATError(f"No AT response from device on {port_name}.")
+    if expect_ok and "OK" not in response:
+        raise DeviceATError(f"AT command did not return OK on {port_name}. Response: {response[:200]}")
+    return response
+
+
 def send_at_command(
     command: str,
     port_name: Optional[str] = None,
@@ -76,47 +138,8 @@ def send_at_command(
         target_port = device.port_name
 
     try:
-        cmd_bytes = command.encode(encoding)
-        if not cmd_bytes.endswith(b"\r\n"):
-            cmd_bytes += b"\r\n"
-
-        with serial.Serial(
-            port=target_port,
-            baudrate=115200,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=timeout,
-            write_timeout=timeout,
-        ) as port:
-            # Clear buffers
-            port.reset_input_buffer()
-            port.reset_output_buffer()
-
-            # Write command
-            try:
-                port.write(cmd_bytes)
-                port.flush()
-            except serial.SerialTimeoutException as ex:
-                raise DeviceATError(f"Write timeout on {target_port}: {ex}.") from ex
-
-            # Read until timeout
-            response_parts: list[str] = []
-            deadline = time.monotonic() + timeout
-            while time.monotonic() < deadline:
-                waiting = port.in_waiting
-                if waiting:
-                    chunk = port.read(waiting)
-                    response_parts.append(chunk.decode(encoding, errors="replace"))
-                else:
-                    time.sleep(0.05)
-
-            response = "".join(response_parts).strip()
-            if not response:
-                raise DeviceATError(f"No AT response from device on {target_port}.")
-            if expect_ok and "OK" not in response:
-                raise DeviceATError(f"AT command did not return OK on {target_port}. Response: {response[:200]}")
-            return response
+        with _open_port(target_port, timeout) as port:
+            return _exchange(port, target_port, command, timeout=timeout, encoding=encoding, expect_ok=expect_ok)
 
     except serial.SerialException as ex:
         raise DeviceATError(
@@ -124,6 +147,100 @@ def send_at_command(
         ) from ex
 
 
+class ATSession:
+    """Serial connection kept open across several AT commands.
+
+    Avoids reopening the port (and renegotiating the USB CDC line) for every
+    command when a device is polled repeatedly. Close it before another tool
+    or function needs the port: serial ports are exclusive on Windows.
+
+    Attributes:
+        port_name: Serial port the session is bound to.
+        timeout: Read/write timeout in seconds.
+        encoding: Text encoding for commands and responses.
+
+    Example:
+        >>> with ATSession() as session:
+        ...     info = session.read_device_info()
+    """
+
+    def __init__(self, port_name: Optional[str] = None, *, timeout: float = 2.0, encoding: str = "utf-8"):
+        """Open the session.
+
+        Args:
+            port_name: Serial port name. If None, auto-detects the first Samsung device port.
+            timeout: Read/write timeout in seconds.
+            encoding: Text encoding for commands and responses.
+
+        Raises:
+            DeviceNotFoundError: If auto-detection fails.
+            DeviceATError: If the port cannot be opened.
+        """
+        self.port_name = port_name or get_first_device().port_name
+        self.timeout = timeout
+        self.encoding = encoding
+        try:
+            self._port: Optional[serial.Serial] = _open_port(self.port_name, timeout)
+        except serial.SerialException as ex:
+            raise DeviceATError(
+                f"Serial communication error on {self.port_name}: {ex}. "
+                "Verify device is connected and drivers are installed."
+            ) from ex
+
+    def send(self, command: str, *, expect_ok: bool = True) -> str:
+        """Send an AT command on the open port and return the raw response.
+
+        Args:
+            command: The AT command to send. CRLF is appended automatically.
+            expect_ok: If True, raises error when "OK" is not present in the response.
+
+        Returns:
+            Raw textual response received from the device.
+
+        Raises:
+            DeviceATError: On serial failures, timeouts, missing OK, or a closed session.
+        """
+        if self._port is None:
+            raise DeviceATError(f"AT session on {self.port_name} is closed.")
+        try:
+            return _exchange(
+                self._port,
+                self.port_name,
+                command,
+                timeout=self.timeout,
+                encoding=self.encoding,
+                expect_ok=expect_ok,
+            )
+        except serial.SerialException as ex:
+            raise DeviceATError(f"Serial communication error on {self.port_name}: {ex}.") from ex
+
+    def read_device_info(self) -> ATDeviceInfo:
+        """Read device information with AT+DEVCONINFO.
+
+        Returns:
+            Device information from AT command response.
+
+        Raises:
+            DeviceATError: If serial communication fails or AT command returns no data.
+        """
+        return _parse_at_response(self.send("AT+DEVCONINFO"), self.port_name)
+
+    def close(self) -> None:
+        """Close the serial port (idempotent)."""
+        if self._port is not None:
+            try:
+                self._port.close()
+            except serial.SerialException:
+                pass
+            self._port = None
+
+    def __enter__(self) -> "ATSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 def enter_download_mode(
     port_name: Optional[str] = None,
     *,
@@ -161,15 +278,7 @@ def enter_download_mode(
     try:
         cmd_bytes = b"AT+FUS?\r\n"
 
-        with serial.Serial(
-            port=target_port,
-            baudrate=115200,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=timeout,
-            write_timeout=timeout,
-        ) as port:
+        with _open_port(target_port, timeout) as port:
             # Clear buffers
             port.reset_input_buffer()
             port.reset_output_buffer()
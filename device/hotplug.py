@@ -0,0 +1,250 @@
+"""USB hotplug notifications for event-driven device detection.
+
+Wakes callers when a USB device is attached or removed instead of forcing them
+to poll the serial bus at a fixed cadence:
+
+- Linux: udev netlink events via the optional ``pyudev`` package.
+- Windows: ``WM_DEVICECHANGE`` broadcasts for ``GUID_DEVINTERFACE_USB_DEVICE``
+  received by a hidden message-only window (ctypes, no extra dependency).
+
+On other platforms, or when the backend cannot be started, :meth:`HotplugWatcher.start`
+returns False and callers should keep polling.
+
+Copyright (c) 2024 nanosamfw contributors
+SPDX-License-Identifier: MIT
+"""
+
+import ctypes
+import logging
+import sys
+import threading
+from ctypes import wintypes
+from typing import Callable, Optional
+
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+logger = logging.getLogger(__name__)
+
+# Hotplug action names passed to the callback (udev naming)
+ACTION_ADD = "add"
+ACTION_REMOVE = "remove"
+
+# Win32 constants (winuser.h / dbt.h)
+_WM_DEVICECHANGE = 0x0219
+_WM_CLOSE = 0x0010
+_WM_DESTROY = 0x0002
+_DBT_DEVICEARRIVAL = 0x8000
+_DBT_DEVICEREMOVECOMPLETE = 0x8004
+_DBT_DEVTYP_DEVICEINTERFACE = 0x00000005
+_DEVICE_NOTIFY_WINDOW_HANDLE = 0x00000000
+_HWND_MESSAGE = -3
+_WINDOW_CLASS_NAME = "nanosamfwHotplugWatcher"
+
+
+class HotplugWatcher:
+    """Background watcher that reports USB attach/remove events.
+
+    Attributes:
+        callback: Function(action) invoked from the watcher thread with
+            ``"add"`` or ``"remove"``. Must be thread-safe and non-blocking.
+    """
+
+    def __init__(self, callback: Callable[[str], None]):
+        """Initialize the watcher (does not start it).
+
+        Args:
+            callback: Function(action) invoked on USB attach/remove events.
+        """
+        self.callback = callback
+        self._observer = None
+        self._thread: Optional[threading.Thread] = None
+        self._hwnd = None
+        # Orders the Windows pump publishing its window against start() giving up on it
+        self._hwnd_lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Whether hotplug events are currently being delivered."""
+        return self._observer is not None or self._hwnd is not None
+
+    def start(self) -> bool:
+        """Start delivering hotplug events.
+
+        Returns:
+            True if a platform backend is running, False if unsupported/unavailable.
+        """
+        if self.active:
+            return True
+        try:
+            if sys.platform.startswith("linux"):
+                return self._start_udev()
+            if sys.platform == "win32":
+                return self._start_win32()
+        except (OSError, ImportError) as ex:
+            # ImportError: pyudev imported, but libudev itself could not be loaded
+            logger.warning("USB hotplug notifications unavailable: %s", ex)
+        return False
+
+    def stop(self) -> None:
+        """Stop delivering hotplug events."""
+        if self._observer is not None:
+            self._observer.send_stop()
+            self._observer = None
+        if self._hwnd is not None:
+            ctypes.windll.user32.PostMessageW(self._hwnd, _WM_CLOSE, 0, 0)
+            self._hwnd = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _start_udev(self) -> bool:
+        """Start the pyudev netlink observer (Linux)."""
+        if pyudev is None:
+            logger.debug("pyudev not installed, USB hotplug notifications disabled")
+            return False
+
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by(subsystem="usb")
+
+        def on_event(udev_device) -> None:
+            if udev_device.action in (ACTION_ADD, ACTION_REMOVE):
+                self.callback(udev_device.action)
+
+        observer = pyudev.MonitorObserver(monitor, callback=on_event, name="usb-hotplug")
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+        return True
+
+    def _start_win32(self) -> bool:
+        """Start the hidden message-only window pump (Windows)."""
+        ready = threading.Event()
+        abort = threading.Event()
+        thread = threading.Thread(target=self._win32_pump, args=(ready, abort), name="usb-hotplug", daemon=True)
+        thread.start()
+        ready.wait(timeout=2.0)
+        with self._hwnd_lock:
+            if self._hwnd is not None:
+                self._thread = thread
+                return True
+            # Creation failed or timed out: a late window must not go live behind our back
+            abort.set()
+        thread.join(timeout=1.0)
+        return False
+
+    def _win32_pump(self, ready: threading.Event, abort: threading.Event) -> None:
+        """Create the notification window and run its message loop.
+
+        Args:
+            ready: Event set once the window is registered (or creation failed).
+            abort: Event set by start() when it gave up waiting; the window is
+                then torn down instead of being published.
+        """
+        # pylint: disable=invalid-name,too-many-locals
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+        class GUID(ctypes.Structure):
+            _fields_ = [
+                ("Data1", wintypes.DWORD),
+                ("Data2", wintypes.WORD),
+                ("Data3", wintypes.WORD),
+                ("Data4", ctypes.c_ubyte * 8),
+            ]
+
+        class DEV_BROADCAST_DEVICEINTERFACE_W(ctypes.Structure):
+            _fields_ = [
+                ("dbcc_size", wintypes.DWORD),
+                ("dbcc_devicetype", wintypes.DWORD),
+                ("dbcc_reserved", wintypes.DWORD),
+                ("dbcc_classguid", GUID),
+                ("dbcc_name", ctypes.c_wchar * 1),
+            ]
+
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [
+                ("style", wintypes.UINT),
+                ("lpfnWndProc", WNDPROC),
+                ("cbClsExtra", ctypes.c_int),
+                ("cbWndExtra", ctypes.c_int),
+                ("hInstance", wintypes.HINSTANCE),
+                ("hIcon", wintypes.HICON),
+                ("hCursor", wintypes.HANDLE),
+                ("hbrBackground", wintypes.HBRUSH),
+                ("lpszMenuName", wintypes.LPCWSTR),
+                ("lpszClassName", wintypes.LPCWSTR),
+            ]
+
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.DefWindowProcW.restype = LRESULT
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.RegisterDeviceNotificationW.restype = wintypes.HANDLE
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg == _WM_DEVICECHANGE:
+                if wparam == _DBT_DEVICEARRIVAL:
+                    self.callback(ACTION_ADD)
+                elif wparam == _DBT_DEVICEREMOVECOMPLETE:
+                    self.callback(ACTION_REMOVE)
+                return 1
+            if msg == _WM_DESTROY:
+                user32.PostQuitMessage(0)
+                return 0
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+        proc = WNDPROC(wnd_proc)  # Keep a reference for the lifetime of the window
+        hinstance = wintypes.HINSTANCE(kernel32.GetModuleHandleW(None))
+        wndclass = WNDCLASSW(lpfnWndProc=proc, hInstance=hinstance, lpszClassName=_WINDOW_CLASS_NAME)
+        user32.RegisterClassW(ctypes.byref(wndclass))
+
+        hwnd = user32.CreateWindowExW(
+            0, _WINDOW_CLASS_NAME, "", 0, 0, 0, 0, 0, wintypes.HWND(_HWND_MESSAGE), None, hinstance, None
+        )
+        if not hwnd:
+            logger.warning("USB hotplug window creation failed (error %d)", kernel32.GetLastError())
+            ready.set()
+            return
+        hwnd = wintypes.HWND(hwnd)
+
+        # GUID_DEVINTERFACE_USB_DEVICE {A5DCBF10-6530-11D2-901F-00C04FB951ED}
+        usb_guid = GUID(
+            0xA5DCBF10, 0x6530, 0x11D2, (ctypes.c_ubyte * 8)(0x90, 0x1F, 0x00, 0xC0, 0x4F, 0xB9, 0x51, 0xED)
+        )
+        notification_filter = DEV_BROADCAST_DEVICEINTERFACE_W(
+            dbcc_size=ctypes.sizeof(DEV_BROADCAST_DEVICEINTERFACE_W),
+            dbcc_devicetype=_DBT_DEVTYP_DEVICEINTERFACE,
+            dbcc_classguid=usb_guid,
+        )
+        notify_handle = user32.RegisterDeviceNotificationW(
+            hwnd, ctypes.byref(notification_filter), _DEVICE_NOTIFY_WINDOW_HANDLE
+        )
+        if not notify_handle:
+            logger.warning("RegisterDeviceNotification failed (error %d)", kernel32.GetLastError())
+            user32.DestroyWindow(hwnd)
+            ready.set()
+            return
+        notify_handle = wintypes.HANDLE(notify_handle)
+
+        with self._hwnd_lock:
+            if abort.is_set():
+                user32.UnregisterDeviceNotification(notify_handle)
+                user32.DestroyWindow(hwnd)
+                user32.UnregisterClassW(_WINDOW_CLASS_NAME, hinstance)
+                return
+            self._hwnd = hwnd
+        ready.set()
+
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+        user32.UnregisterDeviceNotification(notify_handle)
+        user32.UnregisterClassW(_WINDOW_CLASS_NAME, hinstance)
@@ -23,6 +23,7 @@ Main Components:
     - download_and_decrypt: Complete workflow convenience function
     - FirmwareRecord: Repository model with all InformInfo metadata
     - ComponentRecord: Component file model with checksum verification
+    - TaskStoppedError: Raised when a task is stopped via its stop_check callable
     - Database utilities: SQLite initialization, health checks, and cleanup
 
 Features:
@@ -131,6 +132,7 @@ Configuration:
 """
 
 from .db import get_db_path, init_db, is_healthy, repair_db
+from .errors import TaskStoppedError
 from .firmware_repository import (
     ComponentRecord,
     FirmwareRecord,
@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Yannick Locque (yanuino)
+"""
+Download package error definitions.
+
+Exceptions:
+    TaskStoppedError: Raised when a download, decryption or extraction task is
+        stopped by the caller (stop_check returned True).
+"""
+
+
+class TaskStoppedError(RuntimeError):
+    """Raised when a long-running task is stopped via its stop_check callable.
+
+    Subclasses RuntimeError so callers that only handle RuntimeError keep working.
+    """
@@ -10,10 +10,18 @@ decryption services.
 
 from __future__ import annotations
 
+import ctypes
+import os
+import shutil
+import struct
+import sys
+import threading
 import uuid
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import BinaryIO, Callable, Dict, Optional
 
 from fus.client import FUSClient
 from fus.decrypt import decrypt_file, get_v4_key_from_logic
@@ -23,6 +31,7 @@ from fus.messages import build_binary_inform, build_binary_init
 from fus.responses import parse_inform
 
 from .config import PATHS
+from .errors import TaskStoppedError
 from .firmware_repository import (
     ComponentRecord,
     FirmwareRecord,
@@ -36,9 +45,56 @@ from .firmware_repository import (
 )
 from .imei_repository import upsert_imei_event
 
+# Prefer ISA-L for Deflate when installed: its SIMD inflate and CRC-32 are several
+# times faster than zlib. Only _extract_members() uses it; zipfile itself is left
+# on zlib so other ZipFile users in the process (e.g. writers) are unaffected.
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# Errors raised while inflating a corrupt member, by backend
+_INFLATE_ERRORS = (zlib.error,) if isal_zlib is None else (zlib.error, isal_zlib.error)
+
 # Generate unique session ID for this application instance
 _SESSION_ID = str(uuid.uuid4())
 
+# Worker threads for parallel ZIP member extraction (inflate releases the GIL)
+_EXTRACT_WORKERS = min(32, os.cpu_count() or 1)
+# Archives with less uncompressed data than this are extracted on the calling thread
+_PARALLEL_EXTRACT_MIN_BYTES = 64 * 1024 * 1024
+# Copy buffer for streaming ZIP members to disk (multi-GiB AP/BL/CP images)
+_COPY_BUFFER_SIZE = 1024 * 1024
+# Fixed part of a ZIP local file header (PKZIP APPNOTE 4.3.7)
+_LOCAL_HEADER_SIZE = 30
+# fallocate(2) mode: reserve blocks without changing the file size (linux/falloc.h)
+_FALLOC_FL_KEEP_SIZE = 0x01
+# Characters Windows does not allow in file names, mapped to "_" as zipfile does
+_WINDOWS_ILLEGAL_NAME_CHARS = str.maketrans(':<>|"?*', "_" * 7)
+
+
+def _load_fallocate() -> Optional[Callable[[int, int, int, int], int]]:
+    """Return libc's fallocate(fd, mode, offset, len) on Linux, or None.
+
+    os.posix_fallocate() is not used: on filesystems without native support
+    (NFS, FAT/exFAT) glibc emulates it by writing zeros, so every extracted image
+    would be written twice. fallocate(2) fails with EOPNOTSUPP there instead.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = getattr(libc, "fallocate64", None) or libc.fallocate
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    func.restype = ctypes.c_int
+    return func
+
+
+# Native block reservation for extracted files (None where unavailable)
+_fallocate = _load_fallocate()
+
 
 def get_session_id() -> str:
     """Get the current application session ID.
@@ -59,10 +115,11 @@ def check_and_prepare_firmware(
     lock_status: Optional[str] = None,
     aid: Optional[str] = None,
     cc: Optional[str] = None,
+    fota_version: Optional[str] = None,
 ) -> tuple[str, bool]:
     """Check latest firmware via FOTA and determine if cached in repository.
 
-    Always queries Samsung FOTA for latest version. Logs to imei_log with
+    Queries Samsung FOTA for latest version unless fota_version is given. Logs to imei_log with
     status_fus="unknown" (no FUS query yet). Then checks firmware table
     to see if that version has been downloaded (downloaded flag = 1).
 
@@ -79,6 +136,8 @@ def check_and_prepare_firmware(
         lock_status: Optional device lock status (for IMEI log).
         aid: Optional device AID (for IMEI log).
         cc: Optional device country code (for IMEI log).
+        fota_version: Latest version from a recent FOTA query; if given, FOTA is
+            not queried again (the repository cache check still runs).
 
     Returns:
         (latest_version, is_cached): Latest version from FOTA and whether
@@ -111,8 +170,8 @@ def check_and_prepare_firmware(
         status_upgrade="unknown",  # Firmware flashing not implemented
     )
 
-    # 2. Query FOTA for latest version and update record with fota_version
-    version = get_latest_version(model, csc)
+    # 2. Query FOTA for latest version (unless already known) and update record with fota_version
+    version = fota_version or get_latest_version(model, csc)
     version_norm = normalize_vercode(version)
 
     upsert_imei_event(
@@ -170,7 +229,7 @@ def get_or_download_firmware(
     Raises:
         InformError: If FUS inform request fails.
         DownloadError: If download fails or size verification fails.
-        RuntimeError: If task was stopped via stop_check.
+        TaskStoppedError: If task was stopped via stop_check.
 
     Example:
         firmware = get_or_download_firmware(
@@ -214,7 +273,7 @@ def get_or_download_firmware(
         for chunk in resp.iter_content(chunk_size=1024 * 1024):
             # Check if task should stop
             if stop_check and stop_check():
-                raise RuntimeError("Download task stopped by user")
+                raise TaskStoppedError("Download task stopped by user")
             if not chunk:
                 continue
             f.write(chunk)
@@ -251,7 +310,8 @@ def decrypt_firmware(
     *,
     progress_cb: Optional[Callable[[int, int], None]] = None,
     stop_check: Optional[Callable[[], bool]] = None,
-) -> str:
+    firmware: Optional[FirmwareRecord] = None,
+) -> Path:
     """Decrypt firmware from repository.
 
     Decrypts a firmware file that exists in the repository. The decrypted
@@ -263,6 +323,8 @@ def decrypt_firmware(
             PATHS.decrypted_dir/<filename_without_enc4>.
         progress_cb: Optional callback function(bytes_processed, total_bytes).
         stop_check: Optional callable that returns True if task should stop.
+        firmware: Optional repository record for version_code, when the caller
+            already holds it (skips the repository lookup).
 
     Returns:
         Absolute path to the decrypted file.
@@ -271,14 +333,15 @@ def decrypt_firmware(
         ValueError: If firmware not found in repository.
         FileNotFoundError: If encrypted file doesn't exist on disk.
         DecryptError: If decryption fails.
-        RuntimeError: If task was stopped via stop_check.
+        TaskStoppedError: If task was stopped via stop_check.
 
     Example:
         decrypted = decrypt_firmware("A146PXXS6CXK3/...")
         print(f"Decrypted to: {decrypted}")
     """
     # Get firmware from repository
-    firmware = find_firmware(version_code)
+    if firmware is None:
+        firmware = find_firmware(version_code)
     if not firmware:
         raise ValueError(f"Firmware {version_code} not found in repository")
 
@@ -288,7 +351,7 @@ def decrypt_firmware(
 
     # Check if task should stop before starting
     if stop_check and stop_check():
-        raise RuntimeError("Decryption task stopped by user")
+        raise TaskStoppedError("Decryption task stopped by user")
 
     # Determine output path
     if output_path:
@@ -299,18 +362,24 @@ def decrypt_firmware(
 
     # Decrypt using logic value from repository
     key = get_v4_key_from_logic(firmware.latest_fw_version, firmware.logic_value_factory)
-    decrypt_file(
-        str(enc_path),
-        str(dec_path),
-        key=key,
-        progress_cb=progress_cb,
-        stop_check=stop_check,
-    )
+    try:
+        decrypt_file(
+            str(enc_path),
+            str(dec_path),
+            key=key,
+            progress_cb=progress_cb,
+            stop_check=stop_check,
+        )
+    except RuntimeError as ex:
+        # fus.decrypt reports a stop as a plain RuntimeError
+        if stop_check and stop_check():
+            raise TaskStoppedError(str(ex)) from ex
+        raise
 
     # Update repository with decrypted status
     update_firmware_status(version_code, decrypted=1)
 
-    return str(dec_path.resolve())
+    return dec_path.resolve()
 
 
 def download_and_decrypt(
@@ -328,7 +397,7 @@ def download_and_decrypt(
     lock_status: Optional[str] = None,
     aid: Optional[str] = None,
     cc: Optional[str] = None,
-) -> tuple[FirmwareRecord, str]:
+) -> tuple[FirmwareRecord, Path]:
     """Complete workflow: check FOTA, download, and decrypt firmware.
 
     Performs the full workflow:
@@ -360,7 +429,7 @@ def download_and_decrypt(
         (FirmwareRecord, decrypted_file_path)
 
     Raises:
-        RuntimeError: If task was stopped via stop_check.
+        TaskStoppedError: If task was stopped via stop_check.
     """
     # 1. Resolve version and check cache
     if not version:
@@ -379,7 +448,7 @@ def download_and_decrypt(
 
     # Check if task should stop before starting
     if stop_check and stop_check():
-        raise RuntimeError("Download task stopped by user")
+        raise TaskStoppedError("Download task stopped by user")
 
     # 2. Download to repository
     def _dl_cb(done: int, total: int):
@@ -442,6 +511,7 @@ def download_and_decrypt(
         output_path,
         progress_cb=_dec_cb if progress_cb else None,
         stop_check=stop_check,
+        firmware=firmware,
     )
 
     return firmware, decrypted_path
@@ -503,6 +573,211 @@ def cleanup_repository(
     return stats
 
 
+def _member_target(unzip_dir: Path, name: str) -> Path:
+    """Return the extraction path of a ZIP member, confined to unzip_dir.
+
+    Mirrors ZipFile.extract(): drive letters, empty, "." and ".." components are
+    dropped so a member can never be written outside unzip_dir. On Windows,
+    characters illegal in file names are replaced by "_" and trailing dots and
+    spaces are stripped, so a name cannot address an alternate data stream or
+    an invalid path.
+
+    Args:
+        unzip_dir: Extraction directory.
+        name: Member name as stored in the archive.
+
+    Returns:
+        Target path for the member.
+    """
+    arcname = name.replace("/", os.sep)
+    if os.altsep:
+        arcname = arcname.replace(os.altsep, os.sep)
+    parts = [p for p in os.path.splitdrive(arcname)[1].split(os.sep) if p not in ("", os.curdir, os.pardir)]
+    if os.sep == "\\":
+        parts = [p.translate(_WINDOWS_ILLEGAL_NAME_CHARS).rstrip(". ") for p in parts]
+        parts = [p for p in parts if p]
+    return unzip_dir.joinpath(*parts)
+
+
+def _hint_sequential(fd: int, size: int = 0) -> None:
+    """Advise the kernel of sequential access and reserve size bytes (POSIX only).
+
+    Best effort: silently skipped on Windows or filesystems that do not support it.
+    Blocks are only reserved where the filesystem can do so natively (Linux
+    fallocate(2) with FALLOC_FL_KEEP_SIZE), never by writing zeros.
+
+    Args:
+        fd: Open file descriptor.
+        size: Bytes to reserve (0 = no reservation).
+    """
+    try:
+        if size and _fallocate is not None:
+            # Failure (e.g. EOPNOTSUPP) just leaves the file unreserved
+            _fallocate(fd, _FALLOC_FL_KEEP_SIZE, 0, size)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+def _inflate_isal(src: BinaryIO, info: zipfile.ZipInfo, dst: BinaryIO) -> None:
+    """Inflate a Deflate member with ISA-L and verify its size and CRC-32.
+
+    Reads the raw Deflate stream after the member's local header and decodes it
+    in _COPY_BUFFER_SIZE output chunks, so a highly compressed image never
+    inflates into one large buffer.
+
+    Args:
+        src: Archive file object (not shared with other threads).
+        info: Member to extract; must be ZIP_DEFLATED and not encrypted.
+        dst: Target file object.
+
+    Raises:
+        zipfile.BadZipFile: If the local header is invalid, or the member is
+            truncated or does not match its recorded size or CRC-32.
+        isal_zlib.error: If the Deflate stream is corrupt.
+    """
+    src.seek(info.header_offset)
+    header = src.read(_LOCAL_HEADER_SIZE)
+    if len(header) != _LOCAL_HEADER_SIZE or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad magic number for file header of {info.filename!r}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    src.seek(name_len + extra_len, os.SEEK_CUR)
+
+    inflater = isal_zlib.decompressobj(-15)
+    crc32 = isal_zlib.crc32
+    remaining = info.compress_size
+    size = crc = 0
+    while not inflater.eof:
+        data = inflater.unconsumed_tail
+        if not data and remaining:
+            data = src.read(min(remaining, _COPY_BUFFER_SIZE))
+            if not data:
+                raise zipfile.BadZipFile(f"Truncated member {info.filename!r}")
+            remaining -= len(data)
+        # Once all input is consumed, flush() returns what the inflater still holds
+        out = inflater.decompress(data, _COPY_BUFFER_SIZE) if data else inflater.flush()
+        crc = crc32(out, crc)
+        size += len(out)
+        dst.write(out)
+        if not data:
+            break
+    if not inflater.eof or size != info.file_size:
+        raise zipfile.BadZipFile(f"Truncated member {info.filename!r}")
+    if crc != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+
+
+def _extract_members(
+    zip_ref: zipfile.ZipFile,
+    unzip_dir: Path,
+    progress_cb: Optional[Callable[[str, int, int], None]],
+    stop_check: Optional[Callable[[], bool]],
+) -> None:
+    """Extract all ZIP members in parallel.
+
+    Deflate decoding is CPU-bound per member, so large members are decompressed
+    and written concurrently, each streamed to disk with a 1 MiB copy buffer.
+    Deflate members are inflated with ISA-L when it is installed.
+    ZipFile objects are not thread-safe, so zip_ref only supplies the member
+    list: every extracting thread opens its own file and ZipFile on the archive
+    and reads members through that. Directories are created up front so workers
+    never race on makedirs.
+
+    Args:
+        zip_ref: Open ZIP archive, read from disk (its filename is reopened per thread).
+        unzip_dir: Extraction directory.
+        progress_cb: Optional callback invoked as progress_cb("extract", done, total).
+        stop_check: Optional function returning True if extraction should stop.
+
+    Raises:
+        TaskStoppedError: If extraction is stopped by user (stop_check returns True).
+    """
+    infos = zip_ref.infolist()
+    total_files = len(infos)
+
+    # Create the directory tree serially
+    files: list[tuple[zipfile.ZipInfo, Path]] = []
+    for info in infos:
+        target = _member_target(unzip_dir, info.filename)
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            files.append((info, target))
+
+    # Largest members first so one huge AP image does not extract alone at the end
+    files.sort(key=lambda item: item[0].file_size, reverse=True)
+
+    # Each extracting thread reads through its own file object and ZipFile
+    local = threading.local()
+    opened: list[tuple[zipfile.ZipFile, BinaryIO]] = []
+
+    def _thread_archive() -> tuple[zipfile.ZipFile, BinaryIO]:
+        handle = getattr(local, "handle", None)
+        if handle is None:
+            src = open(zip_ref.filename, "rb")  # pylint: disable=consider-using-with
+            try:
+                archive = zipfile.ZipFile(src)
+            except BaseException:
+                src.close()
+                raise
+            opened.append((archive, src))
+            _hint_sequential(src.fileno())
+            handle = local.handle = (archive, src)
+        return handle
+
+    def _extract_one(info: zipfile.ZipInfo, target: Path) -> None:
+        if stop_check and stop_check():
+            raise TaskStoppedError("Extraction task stopped by user")
+        archive, src_file = _thread_archive()
+        # Keep the archived permission bits (always owner-writable so re-extraction works)
+        mode = ((info.external_attr >> 16) & 0o777 or 0o666) | 0o200
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), mode)
+        # Contiguous allocation for multi-GiB images
+        _hint_sequential(fd, info.file_size)
+        # The member's CRC-32 is checked at EOF: the only integrity check between
+        # the resumable download and flashing
+        with os.fdopen(fd, "wb", buffering=0) as dst:
+            if isal_zlib is not None and info.compress_type == zipfile.ZIP_DEFLATED and not info.flag_bits & 0x1:
+                _inflate_isal(src_file, info, dst)
+                return
+            with archive.open(info) as src:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+    done = total_files - len(files)
+    # Report about every 1% of members rather than once per member
+    step = max(1, total_files // 100)
+
+    # Thread start-up is not worth it for a single member or a small archive
+    workers = min(_EXTRACT_WORKERS, len(files))
+    try:
+        if workers < 2 or sum(info.file_size for info, _ in files) < _PARALLEL_EXTRACT_MIN_BYTES:
+            for info, target in files:
+                _extract_one(info, target)
+                done += 1
+                if progress_cb and (done % step == 0 or done == total_files):
+                    progress_cb("extract", done, total_files)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fw-extract") as pool:
+            futures = [pool.submit(_extract_one, info, target) for info, target in files]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    done += 1
+                    if progress_cb and (done % step == 0 or done == total_files):
+                        progress_cb("extract", done, total_files)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        for archive, src in opened:
+            archive.close()
+            src.close()
+
+
 def extract_firmware(
     decrypted_path: Path,
     version_code: Optional[str] = None,
@@ -531,30 +806,26 @@ def extract_firmware(
         Path to the extraction directory.
 
     Raises:
-        ValueError: If the decrypted file does not exist or is not a valid ZIP.
-        RuntimeError: If extraction is stopped by user (stop_check returns True).
+        ValueError: If the decrypted file does not exist, is not a valid ZIP, or a member
+            is corrupt (bad CRC-32 or Deflate stream).
+        TaskStoppedError: If extraction is stopped by user (stop_check returns True).
     """
-    if not decrypted_path.exists():
-        raise ValueError(f"Decrypted file not found: {decrypted_path}")
-
-    if decrypted_path.suffix.lower() not in [".zip"]:
+    if decrypted_path.suffix.lower() != ".zip":
         raise ValueError(f"Expected ZIP file, got: {decrypted_path.suffix}")
 
     try:
+        # Opening the archive doubles as the existence check
+        try:
+            zip_ref = zipfile.ZipFile(decrypted_path, "r")
+        except FileNotFoundError as ex:
+            raise ValueError(f"Decrypted file not found: {decrypted_path}") from ex
+
         unzip_dir = decrypted_path.parent / decrypted_path.stem
-        unzip_dir.mkdir(parents=True, exist_ok=True)
-
-        # Extract files
-        with zipfile.ZipFile(decrypted_path, "r") as zip_ref:
-            members = zip_ref.namelist()
-            # Always extract all files - no filtering at service level
-            total_files = len(members)
-            for idx, member in enumerate(members, 1):
-                if stop_check and stop_check():
-                    raise RuntimeError("Extraction task stopped by user")
-                zip_ref.extract(member, unzip_dir)
-                if progress_cb:
-                    progress_cb("extract", idx, total_files)
+
+        # Extract files - always extract all files, no filtering at service level
+        with zip_ref:
+            unzip_dir.mkdir(parents=True, exist_ok=True)
+            _extract_members(zip_ref, unzip_dir, progress_cb, stop_check)
 
         # Compute MD5 checksums for components (only top-level files)
         component_files = [f for f in unzip_dir.iterdir() if f.is_file()]
@@ -562,7 +833,7 @@ def extract_firmware(
 
         for idx, component_file in enumerate(component_files, 1):
             if stop_check and stop_check():
-                raise RuntimeError("Checksum computation stopped by user")
+                raise TaskStoppedError("Checksum computation stopped by user")
 
             md5sum = compute_md5(component_file)
             size_bytes = component_file.stat().st_size
@@ -590,15 +861,12 @@ def extract_firmware(
             if version_code:
                 firmware = find_firmware(version_code)
                 if firmware:
-                    enc_path = firmware.encrypted_file_path
-                    if enc_path.exists():
-                        enc_path.unlink()
+                    firmware.encrypted_file_path.unlink(missing_ok=True)
 
             # Delete decrypted file
-            if decrypted_path.exists():
-                decrypted_path.unlink()
+            decrypted_path.unlink(missing_ok=True)
 
         return unzip_dir
 
-    except zipfile.BadZipFile as ex:
+    except (zipfile.BadZipFile, *_INFLATE_ERRORS) as ex:
         raise ValueError(f"Invalid ZIP file: {decrypted_path}") from ex
@@ -52,10 +52,15 @@ class InformError(FUSError):
             super().__init__("Missing Status field in inform response")
 
     class BadStatus(FUSError):
-        """Non-200 status code in inform response."""
+        """Non-200 status code in inform response.
+
+        Attributes:
+            status_code: Status code returned by DownloadBinaryInform.
+        """
 
         def __init__(self, status: int):
             super().__init__(f"DownloadBinaryInform returned {status}")
+            self.status_code = status
 
     class MissingField(FUSError):
         """Required field missing from inform response."""